@@ -11,7 +11,7 @@
 -- ============================================================================
 
 -- NFL Teams
-CREATE TABLE nfl_teams (
+CREATE TABLE IF NOT EXISTS nfl_teams (
     id TEXT PRIMARY KEY,
     team_code TEXT UNIQUE NOT NULL, -- e.g., 'NE', 'GB'
     team_name TEXT NOT NULL, -- e.g., 'New England Patriots'
@@ -23,7 +23,7 @@ CREATE TABLE nfl_teams (
 );
 
 -- Players
-CREATE TABLE players (
+CREATE TABLE IF NOT EXISTS players (
     id TEXT PRIMARY KEY,
     nfl_team_id TEXT REFERENCES nfl_teams(id),
     espn_id TEXT UNIQUE, -- ESPN player ID for data sync
@@ -40,10 +40,11 @@ CREATE TABLE players (
     injury_status TEXT, -- 'Questionable', 'Doubtful', 'Out', etc.
     created_at TEXT DEFAULT CURRENT_TIMESTAMP,
     updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+    -- position_rank is added by migrate_database (src/database.py)
 );
 
 -- League Configuration (Single League)
-CREATE TABLE league_config (
+CREATE TABLE IF NOT EXISTS league_config (
     id TEXT PRIMARY KEY,
     league_name TEXT NOT NULL,
     platform TEXT, -- 'ESPN', 'Yahoo', 'Sleeper', 'Custom'
@@ -58,7 +59,7 @@ CREATE TABLE league_config (
 );
 
 -- Fantasy Teams
-CREATE TABLE fantasy_teams (
+CREATE TABLE IF NOT EXISTS fantasy_teams (
     id TEXT PRIMARY KEY,
     owner_name TEXT NOT NULL,
     team_name TEXT NOT NULL,
@@ -77,7 +78,7 @@ CREATE TABLE fantasy_teams (
 -- ============================================================================
 
 -- Roster Positions (defines roster structure)
-CREATE TABLE roster_positions (
+CREATE TABLE IF NOT EXISTS roster_positions (
     id TEXT PRIMARY KEY,
     position TEXT NOT NULL, -- 'QB', 'RB', 'WR', 'TE', 'K', 'DEF', 'FLEX', 'SUPERFLEX'
     count INTEGER NOT NULL, -- number of slots for this position
@@ -86,7 +87,7 @@ CREATE TABLE roster_positions (
 );
 
 -- Roster Entries (actual players on teams)
-CREATE TABLE roster_entries (
+CREATE TABLE IF NOT EXISTS roster_entries (
     id TEXT PRIMARY KEY,
     fantasy_team_id TEXT REFERENCES fantasy_teams(id),
     player_id TEXT REFERENCES players(id),
@@ -103,7 +104,7 @@ CREATE TABLE roster_entries (
 -- ============================================================================
 
 -- NFL Games/Events
-CREATE TABLE nfl_games (
+CREATE TABLE IF NOT EXISTS nfl_games (
     id TEXT PRIMARY KEY,
     season_year INTEGER NOT NULL,
     week INTEGER NOT NULL,
@@ -118,7 +119,7 @@ CREATE TABLE nfl_games (
 );
 
 -- Player Game Statistics
-CREATE TABLE player_game_stats (
+CREATE TABLE IF NOT EXISTS player_game_stats (
     id TEXT PRIMARY KEY,
     player_id TEXT REFERENCES players(id),
     nfl_game_id TEXT REFERENCES nfl_games(id),
@@ -142,7 +143,7 @@ CREATE TABLE player_game_stats (
 );
 
 -- Team Defense Game Statistics
-CREATE TABLE team_defense_game_stats (
+CREATE TABLE IF NOT EXISTS team_defense_game_stats (
     id TEXT PRIMARY KEY,
     nfl_team_id TEXT REFERENCES nfl_teams(id),
     nfl_game_id TEXT REFERENCES nfl_games(id),
@@ -163,7 +164,7 @@ CREATE TABLE team_defense_game_stats (
 -- ============================================================================
 
 -- Fantasy Matchups
-CREATE TABLE fantasy_matchups (
+CREATE TABLE IF NOT EXISTS fantasy_matchups (
     id TEXT PRIMARY KEY,
     week INTEGER NOT NULL,
     home_team_id TEXT REFERENCES fantasy_teams(id),
@@ -177,7 +178,7 @@ CREATE TABLE fantasy_matchups (
 );
 
 -- Fantasy Team Weekly Scores
-CREATE TABLE fantasy_team_weekly_scores (
+CREATE TABLE IF NOT EXISTS fantasy_team_weekly_scores (
     id TEXT PRIMARY KEY,
     fantasy_team_id TEXT REFERENCES fantasy_teams(id),
     week INTEGER NOT NULL,
@@ -193,7 +194,7 @@ CREATE TABLE fantasy_team_weekly_scores (
 -- ============================================================================
 
 -- Player Projections
-CREATE TABLE player_projections (
+CREATE TABLE IF NOT EXISTS player_projections (
     id TEXT PRIMARY KEY,
     player_id TEXT REFERENCES players(id),
     week INTEGER NOT NULL,
@@ -213,7 +214,7 @@ CREATE TABLE player_projections (
 );
 
 -- Player Rankings
-CREATE TABLE player_rankings (
+CREATE TABLE IF NOT EXISTS player_rankings (
     id TEXT PRIMARY KEY,
     player_id TEXT REFERENCES players(id),
     position TEXT NOT NULL,
@@ -231,7 +232,7 @@ CREATE TABLE player_rankings (
 -- ============================================================================
 
 -- Trade Proposals
-CREATE TABLE trade_proposals (
+CREATE TABLE IF NOT EXISTS trade_proposals (
     id TEXT PRIMARY KEY,
     proposing_team_id TEXT REFERENCES fantasy_teams(id),
     receiving_team_id TEXT REFERENCES fantasy_teams(id),
@@ -244,7 +245,7 @@ CREATE TABLE trade_proposals (
 );
 
 -- Trade Items (players/picks involved in trades)
-CREATE TABLE trade_items (
+CREATE TABLE IF NOT EXISTS trade_items (
     id TEXT PRIMARY KEY,
     trade_proposal_id TEXT REFERENCES trade_proposals(id),
     team_id TEXT REFERENCES fantasy_teams(id), -- Team giving up this item
@@ -255,7 +256,7 @@ CREATE TABLE trade_items (
 );
 
 -- Trade Analysis Results
-CREATE TABLE trade_analysis (
+CREATE TABLE IF NOT EXISTS trade_analysis (
     id TEXT PRIMARY KEY,
     trade_proposal_id TEXT REFERENCES trade_proposals(id),
     team_a_value REAL, -- Fantasy value gained/lost
@@ -271,7 +272,7 @@ CREATE TABLE trade_analysis (
 -- ============================================================================
 
 -- Waiver Wire Priority
-CREATE TABLE waiver_priorities (
+CREATE TABLE IF NOT EXISTS waiver_priorities (
     id TEXT PRIMARY KEY,
     fantasy_team_id TEXT REFERENCES fantasy_teams(id),
     priority_order INTEGER NOT NULL,
@@ -281,7 +282,7 @@ CREATE TABLE waiver_priorities (
 );
 
 -- Free Agent Recommendations
-CREATE TABLE free_agent_recommendations (
+CREATE TABLE IF NOT EXISTS free_agent_recommendations (
     id TEXT PRIMARY KEY,
     player_id TEXT REFERENCES players(id),
     week INTEGER NOT NULL,
@@ -296,21 +297,29 @@ CREATE TABLE free_agent_recommendations (
 -- ============================================================================
 
 -- Player indexes
-CREATE INDEX idx_players_position ON players(position);
-CREATE INDEX idx_players_team ON players(nfl_team_id);
-CREATE INDEX idx_players_active ON players(is_active);
+CREATE INDEX IF NOT EXISTS idx_players_position ON players(position);
+CREATE INDEX IF NOT EXISTS idx_players_team ON players(nfl_team_id);
+CREATE INDEX IF NOT EXISTS idx_players_active ON players(is_active);
 
 -- Statistics indexes
-CREATE INDEX idx_player_stats_player_week ON player_game_stats(player_id, nfl_game_id);
-CREATE INDEX idx_player_stats_week ON player_game_stats(nfl_game_id);
+CREATE INDEX IF NOT EXISTS idx_player_stats_player_week ON player_game_stats(player_id, nfl_game_id);
+CREATE INDEX IF NOT EXISTS idx_player_stats_week ON player_game_stats(nfl_game_id);
 
 -- Fantasy indexes
-CREATE INDEX idx_roster_entries_team ON roster_entries(fantasy_team_id);
-CREATE INDEX idx_fantasy_matchups_week ON fantasy_matchups(week);
+CREATE INDEX IF NOT EXISTS idx_roster_entries_team_starting ON roster_entries(fantasy_team_id, is_starting DESC);
+CREATE INDEX IF NOT EXISTS idx_roster_entries_player ON roster_entries(player_id);
+CREATE INDEX IF NOT EXISTS idx_fantasy_matchups_week ON fantasy_matchups(week);
+CREATE INDEX IF NOT EXISTS idx_fantasy_matchups_home_week ON fantasy_matchups(home_team_id, week);
+CREATE INDEX IF NOT EXISTS idx_fantasy_matchups_away_week ON fantasy_matchups(away_team_id, week);
 
 -- Projections indexes
-CREATE INDEX idx_projections_player_week ON player_projections(player_id, week, season_year);
-CREATE INDEX idx_rankings_position_week ON player_rankings(position, week, season_year);
+CREATE INDEX IF NOT EXISTS idx_projections_player_week ON player_projections(player_id, week, season_year);
+CREATE INDEX IF NOT EXISTS idx_rankings_position_week ON player_rankings(position, week, season_year);
+CREATE INDEX IF NOT EXISTS idx_rankings_player_created ON player_rankings(player_id, created_at DESC);
+
+-- Trade indexes
+CREATE INDEX IF NOT EXISTS idx_trade_items_proposal ON trade_items(trade_proposal_id);
+CREATE INDEX IF NOT EXISTS idx_trade_analysis_proposal ON trade_analysis(trade_proposal_id);
 
 -- ============================================================================
 -- TRIGGERS FOR UPDATED_AT
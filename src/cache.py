@@ -0,0 +1,55 @@
+"""
+In-process TTL cache for read-only API endpoints
+"""
+
+import time
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+# Every cached function, so they can all be invalidated after a data reload
+_cached_functions: list[Callable] = []
+
+
+def ttl_cache(seconds: float) -> Callable[[Callable], Callable]:
+    """
+    Cache the result of a zero-argument function for a fixed number of seconds
+
+    Args:
+        seconds: How long a computed result stays valid
+
+    Returns:
+        Decorator exposing a cache_clear() method on the wrapped function
+    """
+
+    def decorator(func: Callable[[], Any]) -> Callable[[], Any]:
+        # (expires_at, value), replaced in a single assignment so threadpool workers
+        # and cache_clear() never observe a half-updated entry
+        entry: tuple[float, Any] | None = None
+
+        @wraps(func)
+        def wrapper() -> Any:
+            nonlocal entry
+            now = time.monotonic()
+            current = entry
+            if current is not None and now < current[0]:
+                return current[1]
+            value = func()
+            entry = (now + seconds, value)
+            return value
+
+        def cache_clear() -> None:
+            nonlocal entry
+            entry = None
+
+        wrapper.cache_clear = cache_clear
+        _cached_functions.append(wrapper)
+        return wrapper
+
+    return decorator
+
+
+def clear_all_caches() -> None:
+    """Invalidate every ttl_cache-decorated function"""
+    for func in _cached_functions:
+        func.cache_clear()
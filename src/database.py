@@ -4,8 +4,32 @@ Database connection and utilities for SQLite
 
 import os
 import sqlite3
-from collections.abc import Generator
+from collections.abc import Generator, Sequence
 from contextlib import contextmanager
+from functools import cache
+
+from src.models import DatabaseModel
+
+# Roster display order (QB, RB, WR, TE, K, DEF, other). Defined only here: every
+# database, new or old, gets it from migrate_database. ALTER TABLE can only add
+# VIRTUAL generated columns.
+PLAYERS_POSITION_RANK_COLUMN = """
+    position_rank INTEGER GENERATED ALWAYS AS (
+        CASE position
+            WHEN 'QB' THEN 1
+            WHEN 'RB' THEN 2
+            WHEN 'WR' THEN 3
+            WHEN 'TE' THEN 4
+            WHEN 'K' THEN 5
+            WHEN 'DEF' THEN 6
+            ELSE 7
+        END
+    ) VIRTUAL
+"""
+
+
+# DDL for the whole database; every statement is idempotent
+SCHEMA_PATH = os.path.join(os.path.dirname(__file__), "..", "database", "schema.sql")
 
 
 def get_database_path() -> str:
@@ -13,12 +37,29 @@ def get_database_path() -> str:
     return os.getenv("SQLITE_DB_PATH", "data/fantasy_football.db")
 
 
+def is_uri(db_path: str) -> bool:
+    """Whether a database path is an SQLite URI rather than a file name"""
+    return db_path.startswith("file:")
+
+
 @contextmanager
-def get_db_connection() -> Generator[sqlite3.Connection]:
-    """Get a database connection with proper configuration"""
+def get_db_connection(check_same_thread: bool = True) -> Generator[sqlite3.Connection]:
+    """
+    Get a database connection with proper configuration
+
+    Args:
+        check_same_thread: Pass False for a connection that is handed between threads,
+            one at a time, such as one driven from anyio.to_thread
+
+    Yields:
+        Open connection, closed when the context exits
+    """
     db_path = get_database_path()
-    conn = sqlite3.connect(db_path)
+    # "file:" paths are SQLite URIs, e.g. file:test?mode=memory&cache=shared
+    conn = sqlite3.connect(db_path, uri=is_uri(db_path), check_same_thread=check_same_thread)
     conn.row_factory = sqlite3.Row  # Enable dict-like access to rows
+    # Safe with WAL (set in init_database): commits no longer fsync the main database file
+    conn.execute("PRAGMA synchronous=NORMAL")
     try:
         yield conn
     finally:
@@ -28,45 +69,141 @@ def get_db_connection() -> Generator[sqlite3.Connection]:
 def init_database() -> None:
     """Initialize the database with schema"""
     db_path = get_database_path()
-    if not os.path.exists(db_path):
-        # Create the directory if it doesn't exist
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    # Create the directory if it doesn't exist
+    db_dir = os.path.dirname(db_path)
+    if db_dir and not is_uri(db_path):
+        os.makedirs(db_dir, exist_ok=True)
+
+    with get_db_connection() as conn:
+        # WAL is persistent, so enabling it once here applies to every later connection
+        conn.execute("PRAGMA journal_mode=WAL")
+        # Every statement is IF NOT EXISTS, so existing databases gain newly added tables
+        # and indexes. A changed definition needs a new name (and its old index dropped
+        # in migrate_database), since IF NOT EXISTS skips any index that already exists.
+        conn.executescript(schema_sql())
+        migrate_database(conn)
+        conn.commit()
+
+
+@cache
+def schema_sql() -> str:
+    """Read (and cache) the DDL script that creates every table and index"""
+    with open(SCHEMA_PATH) as f:
+        return f.read()
+
+
+# Indexes that were renamed or dropped from schema.sql
+OBSOLETE_INDEXES = ("idx_roster_entries_team", "idx_players_position_rank")
+
+
+def migrate_database(conn: sqlite3.Connection) -> None:
+    """
+    Add columns and drop indexes changed after a database was first created
 
-        # Read and execute schema
-        schema_path = os.path.join(os.path.dirname(__file__), "..", "database", "schema.sql")
-        with open(schema_path) as f:
-            schema = f.read()
+    Runs after the schema script, so new databases get the added columns here too.
+    """
+    for index_name in OBSOLETE_INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {index_name}")
 
-        with get_db_connection() as conn:
-            conn.executescript(schema)
-            conn.commit()
+    # table_xinfo (unlike table_info) also lists generated columns
+    columns = {row["name"] for row in conn.execute("PRAGMA table_xinfo(players)")}
+    if columns and "position_rank" not in columns:
+        conn.execute(f"ALTER TABLE players ADD COLUMN {PLAYERS_POSITION_RANK_COLUMN}")
 
 
-def execute_query(query: str, params: tuple = ()) -> list:
-    """Execute a query and return results"""
+def analyze_database() -> None:
+    """Refresh the query planner statistics so SQLite picks the right indexes"""
+    with get_db_connection() as conn:
+        conn.execute("ANALYZE")
+        conn.commit()
+
+
+def execute_query(query: str, params: tuple = (), conn: sqlite3.Connection | None = None) -> list:
+    """Execute a query and return results, on conn if given or a new connection otherwise"""
+    if conn is not None:
+        return conn.execute(query, params).fetchall()
     with get_db_connection() as conn:
         cursor = conn.execute(query, params)
         return cursor.fetchall()
 
 
-def execute_insert(query: str, params: tuple = ()) -> int:
-    """Execute an insert query and return the last row id"""
+def rows_to_dicts(rows: list[sqlite3.Row]) -> list[dict]:
+    """Convert rows to dicts, reading the column names once per result set"""
+    if not rows:
+        return []
+    columns = rows[0].keys()
+    return [dict(zip(columns, row)) for row in rows]
+
+
+@cache
+def insert_sql(table: str, columns: tuple[str, ...]) -> str:
+    """Build (and cache) a parameterized INSERT statement for the given columns"""
+    placeholders = ", ".join("?" * len(columns))
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+
+def insert_models(conn: sqlite3.Connection, models: Sequence[DatabaseModel]) -> int:
+    """
+    Insert models of a single type with one executemany call
+
+    The caller owns the transaction and is responsible for committing.
+
+    Args:
+        conn: Open database connection
+        models: Models to insert, all of the same class
+
+    Returns:
+        Number of rows inserted
+    """
+    if not models:
+        return 0
+    model_type = type(models[0])
+    conn.executemany(
+        insert_sql(model_type.table_name, model_type.column_names()),
+        (model.to_row_tuple() for model in models),
+    )
+    return len(models)
+
+
+def execute_insert(query: str, params: tuple = (), conn: sqlite3.Connection | None = None) -> int:
+    """
+    Execute an insert query and return the last row id
+
+    When conn is given the insert runs on it and the caller commits; otherwise a
+    new connection is opened and committed.
+    """
+    if conn is not None:
+        return conn.execute(query, params).lastrowid
     with get_db_connection() as conn:
         cursor = conn.execute(query, params)
         conn.commit()
         return cursor.lastrowid
 
 
-def execute_update(query: str, params: tuple = ()) -> int:
-    """Execute an update query and return the number of affected rows"""
+def execute_update(query: str, params: tuple = (), conn: sqlite3.Connection | None = None) -> int:
+    """
+    Execute an update query and return the number of affected rows
+
+    When conn is given the update runs on it and the caller commits; otherwise a
+    new connection is opened and committed.
+    """
+    if conn is not None:
+        return conn.execute(query, params).rowcount
     with get_db_connection() as conn:
         cursor = conn.execute(query, params)
         conn.commit()
         return cursor.rowcount
 
 
-def execute_delete(query: str, params: tuple = ()) -> int:
-    """Execute a delete query and return the number of affected rows"""
+def execute_delete(query: str, params: tuple = (), conn: sqlite3.Connection | None = None) -> int:
+    """
+    Execute a delete query and return the number of affected rows
+
+    When conn is given the delete runs on it and the caller commits; otherwise a
+    new connection is opened and committed.
+    """
+    if conn is not None:
+        return conn.execute(query, params).rowcount
     with get_db_connection() as conn:
         cursor = conn.execute(query, params)
         conn.commit()
@@ -7,14 +7,14 @@ including API access, data conversion, and database operations.
 
 import logging
 import os
-import uuid
+import sqlite3
 from typing import Any
 
 from espn_api.football import League as ESPNLeague
 from espn_api.football import Player as ESPNPlayer
 from espn_api.football import Team as ESPNTeam
 
-from src.database import get_db_connection
+from src.database import get_db_connection, insert_models
 from src.logging_config import get_logger
 from src.models import (
     AcquisitionType,
@@ -26,6 +26,7 @@ from src.models import (
     Position,
     RosterEntry,
     ScoringType,
+    _new_id,
 )
 
 logger = get_logger(__name__)
@@ -44,15 +45,6 @@ def get_league_config_from_env() -> tuple[int, int]:
     return league_id, year
 
 
-def safe_enum_value(enum_obj) -> str:
-    """Safely get enum value as string"""
-    if enum_obj is None:
-        return None
-    if hasattr(enum_obj, "value"):
-        return str(enum_obj.value)
-    return str(enum_obj)
-
-
 def determine_scoring_type(espn_league: ESPNLeague) -> ScoringType:
     """Determine scoring type from ESPN league settings"""
     try:
@@ -68,19 +60,37 @@ def determine_scoring_type(espn_league: ESPNLeague) -> ScoringType:
         return ScoringType.STANDARD
 
 
+# ESPN position strings mapped to our Position enum, built once at import
+ESPN_POSITION_MAPPING = {
+    "QB": Position.QB,
+    "RB": Position.RB,
+    "WR": Position.WR,
+    "TE": Position.TE,
+    "K": Position.K,
+    "DEF": Position.DEF,
+    "FLEX": Position.FLEX,
+    "SUPERFLEX": Position.SUPERFLEX,
+}
+
+
 def map_espn_position(espn_position: str) -> Position:
     """Map ESPN position to our Position enum"""
-    position_mapping = {
-        "QB": Position.QB,
-        "RB": Position.RB,
-        "WR": Position.WR,
-        "TE": Position.TE,
-        "K": Position.K,
-        "DEF": Position.DEF,
-        "FLEX": Position.FLEX,
-        "SUPERFLEX": Position.SUPERFLEX,
-    }
-    return position_mapping.get(espn_position, Position.QB)
+    return ESPN_POSITION_MAPPING.get(espn_position, Position.QB)
+
+
+# ESPN roster acquisition types mapped to our AcquisitionType enum. ESPN reports both
+# waiver claims and free agent pickups as "ADD".
+ESPN_ACQUISITION_TYPE_MAPPING = {
+    "DRAFT": AcquisitionType.DRAFT,
+    "ADD": AcquisitionType.FREE_AGENT,
+    "WAIVER": AcquisitionType.WAIVER,
+    "TRADE": AcquisitionType.TRADE,
+}
+
+
+def map_espn_acquisition_type(espn_acquisition_type: str | None) -> AcquisitionType:
+    """Map ESPN acquisition type to our AcquisitionType enum"""
+    return ESPN_ACQUISITION_TYPE_MAPPING.get(espn_acquisition_type, AcquisitionType.FREE_AGENT)
 
 
 def convert_league_config(espn_league: ESPNLeague) -> LeagueConfig:
@@ -175,7 +185,7 @@ def convert_player(espn_player: ESPNPlayer) -> Player:
 
         return Player(
             name=espn_player.name,
-            position=position,
+            position=position.value,
             nfl_team_id=nfl_team_id,
             espn_id=str(espn_player.playerId),
             jersey_number=jersey_number,
@@ -194,27 +204,22 @@ def convert_player(espn_player: ESPNPlayer) -> Player:
 
 def get_all_players(espn_league: ESPNLeague) -> list[ESPNPlayer]:
     """Get all players from ESPN league (rosters + free agents)"""
-    all_players = []
-    seen_player_ids = set()
+    # Keyed by player id so each player is kept once, in first-seen order
+    players_by_id = {}
 
     # Get players from team rosters
     for team in espn_league.teams:
         for player in team.roster:
-            if str(player.playerId) not in seen_player_ids:
-                all_players.append(player)
-                seen_player_ids.add(str(player.playerId))
+            players_by_id.setdefault(str(player.playerId), player)
 
     # Get free agents if available (call as method)
     try:
-        free_agents = espn_league.free_agents()
-        for player in free_agents:
-            if str(player.playerId) not in seen_player_ids:
-                all_players.append(player)
-                seen_player_ids.add(str(player.playerId))
+        for player in espn_league.free_agents():
+            players_by_id.setdefault(str(player.playerId), player)
     except Exception as e:
         logger.warning(f"Could not get free agents: {e}")
 
-    return all_players
+    return list(players_by_id.values())
 
 
 def convert_players(espn_league: ESPNLeague) -> list[Player]:
@@ -255,9 +260,7 @@ def convert_roster_entries(
             is_starting = getattr(player, "starter", False)
 
             # Determine acquisition type
-            acquisition_type = AcquisitionType.FREE_AGENT
-            if hasattr(player, "acquisitionType"):
-                acquisition_type = player.acquisitionType
+            acquisition_type = map_espn_acquisition_type(getattr(player, "acquisitionType", None))
 
             # Create roster entry
             roster_entry = RosterEntry(
@@ -355,6 +358,75 @@ def get_league_data(
         raise ESPNFantasyError(f"Failed to get league data: {e}")
 
 
+def save_league_data(
+    conn: sqlite3.Connection,
+    league_config: LeagueConfig,
+    teams: list[FantasyTeam],
+    players: list[Player],
+    roster_entries: list[RosterEntry],
+    matchups: list[FantasyMatchup],
+) -> None:
+    """
+    Replace the league data in the database with the given models
+
+    Models are inserted with their own ids, which get_league_data already uses to
+    link roster entries and matchups to teams and players. Each table is written
+    with a single executemany; the caller commits the transaction.
+    """
+    # Clear existing data
+    conn.execute("DELETE FROM fantasy_matchups")
+    conn.execute("DELETE FROM roster_entries")
+    conn.execute("DELETE FROM players")
+    conn.execute("DELETE FROM fantasy_teams")
+    conn.execute("DELETE FROM league_config")
+
+    insert_models(conn, [league_config])
+    insert_models(conn, teams)
+    insert_models(conn, players)
+
+    team_ids = {team.id for team in teams}
+    player_ids = {player.id for player in players}
+
+    # Only keep roster entries whose team and player are part of this league
+    roster_entries = [
+        entry
+        for entry in roster_entries
+        if entry.fantasy_team_id in team_ids and entry.player_id in player_ids
+    ]
+    if roster_entries:
+        # Get or create a default roster position (use bench as default), once for all entries
+        cursor = conn.execute("SELECT id FROM roster_positions WHERE position = ?", ("BN",))
+        roster_position_row = cursor.fetchone()
+        if roster_position_row:
+            roster_position_id = roster_position_row["id"]
+        else:
+            # Create a default bench position if none exists
+            roster_position_id = _new_id()
+            conn.execute(
+                """
+                INSERT INTO roster_positions (id, position, count, is_bench)
+                VALUES (?, ?, ?, ?)
+                """,
+                (roster_position_id, "BN", 1, 1),
+            )
+
+        for entry in roster_entries:
+            if entry.roster_position_id is None:
+                entry.roster_position_id = roster_position_id
+            if entry.acquisition_type is None:
+                entry.acquisition_type = AcquisitionType.FREE_AGENT
+        insert_models(conn, roster_entries)
+
+    insert_models(
+        conn,
+        [
+            matchup
+            for matchup in matchups
+            if matchup.home_team_id in team_ids and matchup.away_team_id in team_ids
+        ],
+    )
+
+
 def init_espn_data() -> bool:
     """Initialize the database with ESPN data"""
     logger.info("Initializing database with ESPN data...")
@@ -373,158 +445,7 @@ def init_espn_data() -> bool:
         league_config, teams, players, roster_entries, matchups = get_league_data(league_id, year)
 
         with get_db_connection() as conn:
-            # Clear existing data
-            conn.execute("DELETE FROM fantasy_matchups")
-            conn.execute("DELETE FROM roster_entries")
-            conn.execute("DELETE FROM players")
-            conn.execute("DELETE FROM fantasy_teams")
-            conn.execute("DELETE FROM league_config")
-
-            # Insert league configuration
-            league_db_id = str(uuid.uuid4())
-            conn.execute(
-                """
-                INSERT INTO league_config (id, league_name, platform, platform_league_id, season_year, scoring_type, team_count, playoff_teams)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    league_db_id,
-                    league_config.league_name,
-                    safe_enum_value(league_config.platform),
-                    league_config.platform_league_id,
-                    league_config.season_year,
-                    safe_enum_value(league_config.scoring_type),
-                    league_config.team_count,
-                    league_config.playoff_teams,
-                ),
-            )
-
-            # Insert fantasy teams
-            team_mapping = {}  # ESPN team ID -> database team ID
-            for team in teams:
-                team_db_id = str(uuid.uuid4())
-                team_mapping[team.platform_team_id] = team_db_id
-
-                conn.execute(
-                    """
-                    INSERT INTO fantasy_teams (id, owner_name, team_name, platform_team_id, wins, losses, ties, points_for, points_against)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        team_db_id,
-                        team.owner_name,
-                        team.team_name,
-                        team.platform_team_id,
-                        team.wins,
-                        team.losses,
-                        team.ties,
-                        team.points_for,
-                        team.points_against,
-                    ),
-                )
-
-            # Insert players
-            player_mapping = {}  # ESPN player ID -> database player ID
-            for player in players:
-                player_db_id = str(uuid.uuid4())
-                player_mapping[player.espn_id] = player_db_id
-
-                # Debug: print the values being inserted
-                values = (
-                    player_db_id,
-                    player.nfl_team_id,
-                    player.name,
-                    safe_enum_value(player.position),
-                    player.espn_id,
-                    player.jersey_number,
-                    player.height,
-                    player.weight,
-                    player.age,
-                    player.experience_years,
-                    player.college,
-                    1 if player.is_injured else 0,
-                    player.injury_status,
-                    1 if player.is_active else 0,
-                )
-
-                logger.debug(f"Inserting player {player.name}")
-
-                conn.execute(
-                    """
-                    INSERT INTO players (id, nfl_team_id, name, position, espn_id, jersey_number, height, weight, age, experience_years, college, is_injured, injury_status, is_active)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    values,
-                )
-
-            # Insert roster entries
-            for roster_entry in roster_entries:
-                roster_db_id = str(uuid.uuid4())
-                fantasy_team_id = team_mapping.get(roster_entry.fantasy_team_id)
-                player_id = player_mapping.get(roster_entry.player_id)
-
-                if fantasy_team_id and player_id:
-                    # Get or create a default roster position (use bench as default)
-                    position_value = "BN"
-                    cursor = conn.execute(
-                        "SELECT id FROM roster_positions WHERE position = ?", (position_value,)
-                    )
-                    roster_position_row = cursor.fetchone()
-                    if roster_position_row:
-                        roster_position_id = roster_position_row["id"]
-                    else:
-                        # Create a default bench position if none exists
-                        roster_position_id = str(uuid.uuid4())
-                        conn.execute(
-                            """
-                            INSERT INTO roster_positions (id, position, count, is_bench)
-                            VALUES (?, ?, ?, ?)
-                            """,
-                            (roster_position_id, "BN", 1, 1),
-                        )
-
-                    conn.execute(
-                        """
-                        INSERT INTO roster_entries (id, fantasy_team_id, player_id, roster_position_id, is_starting, acquisition_type)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            roster_db_id,
-                            fantasy_team_id,
-                            player_id,
-                            roster_position_id,
-                            1 if roster_entry.is_starting else 0,
-                            safe_enum_value(roster_entry.acquisition_type)
-                            if roster_entry.acquisition_type
-                            else "Free Agent",
-                        ),
-                    )
-
-            # Insert matchups
-            for matchup in matchups:
-                matchup_db_id = str(uuid.uuid4())
-                home_team_id = team_mapping.get(matchup.home_team_id)
-                away_team_id = team_mapping.get(matchup.away_team_id)
-                winner_id = team_mapping.get(matchup.winner_id) if matchup.winner_id else None
-
-                if home_team_id and away_team_id:
-                    conn.execute(
-                        """
-                        INSERT INTO fantasy_matchups (id, week, home_team_id, away_team_id, home_score, away_score, winner_id, is_playoff)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            matchup_db_id,
-                            matchup.week,
-                            home_team_id,
-                            away_team_id,
-                            matchup.home_score,
-                            matchup.away_score,
-                            winner_id,
-                            1 if matchup.is_playoff else 0,
-                        ),
-                    )
-
+            save_league_data(conn, league_config, teams, players, roster_entries, matchups)
             conn.commit()
             logger.info(f"Successfully initialized database with ESPN data:")
             logger.info(f"  - League: {league_config.league_name}")
@@ -2,11 +2,11 @@
 Database initialization script to populate sample data
 """
 
-import uuid
 from datetime import datetime
 
 from .database import execute_insert, get_db_connection
 from .logging_config import get_logger
+from .models import _new_id
 
 
 def init_sample_data():
@@ -14,7 +14,9 @@ def init_sample_data():
     logger = get_logger(__name__)
     logger.info("Initializing sample data...")
 
-    with get_db_connection() as conn:
+    # The connection's own context manager wraps every insert in one transaction,
+    # committing on success and rolling back if any insert fails
+    with get_db_connection() as conn, conn:
         # Insert NFL Teams
         nfl_teams = [
             ("NE", "New England Patriots", "Boston", "AFC", "East"),
@@ -51,18 +53,16 @@ def init_sample_data():
             ("SEA", "Seattle Seahawks", "Seattle", "NFC", "West"),
         ]
 
-        for team_code, team_name, city, conference, division in nfl_teams:
-            team_id = str(uuid.uuid4())
-            conn.execute(
-                """
-                INSERT INTO nfl_teams (id, team_code, team_name, city, conference, division)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """,
-                (team_id, team_code, team_name, city, conference, division),
-            )
+        conn.executemany(
+            """
+            INSERT INTO nfl_teams (id, team_code, team_name, city, conference, division)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """,
+            [(_new_id(), *nfl_team) for nfl_team in nfl_teams],
+        )
 
         # Insert League Configuration
-        league_id = str(uuid.uuid4())
+        league_id = _new_id()
         conn.execute(
             """
             INSERT INTO league_config (id, league_name, platform, season_year, scoring_type, team_count, playoff_teams)
@@ -87,17 +87,17 @@ def init_sample_data():
             ("Patricia White", "White's Warriors"),
         ]
 
-        team_ids = []
-        for owner_name, team_name in fantasy_teams:
-            team_id = str(uuid.uuid4())
-            team_ids.append(team_id)
-            conn.execute(
-                """
-                INSERT INTO fantasy_teams (id, owner_name, team_name)
-                VALUES (?, ?, ?)
-            """,
-                (team_id, owner_name, team_name),
-            )
+        team_ids = [_new_id() for _ in fantasy_teams]
+        conn.executemany(
+            """
+            INSERT INTO fantasy_teams (id, owner_name, team_name)
+            VALUES (?, ?, ?)
+        """,
+            [
+                (team_id, owner_name, team_name)
+                for team_id, (owner_name, team_name) in zip(team_ids, fantasy_teams)
+            ],
+        )
 
         # Insert Roster Positions
         roster_positions = [
@@ -111,15 +111,17 @@ def init_sample_data():
             ("BN", 6, 1),  # Bench positions
         ]
 
-        for position, count, is_bench in roster_positions:
-            position_id = str(uuid.uuid4())
-            conn.execute(
-                """
-                INSERT INTO roster_positions (id, position, count, is_bench)
-                VALUES (?, ?, ?, ?)
-            """,
-                (position_id, position, count, is_bench),
-            )
+        roster_position_ids = {position: _new_id() for position, _, _ in roster_positions}
+        conn.executemany(
+            """
+            INSERT INTO roster_positions (id, position, count, is_bench)
+            VALUES (?, ?, ?, ?)
+        """,
+            [
+                (roster_position_ids[position], position, count, is_bench)
+                for position, count, is_bench in roster_positions
+            ],
+        )
 
         # Insert Sample Players
         sample_players = [
@@ -177,21 +179,20 @@ def init_sample_data():
         for row in cursor.fetchall():
             team_id_map[row["team_code"]] = row["id"]
 
-        player_ids = []
-        for player_name, position, team_code in sample_players:
-            player_id = str(uuid.uuid4())
-            player_ids.append(player_id)
-            nfl_team_id = team_id_map.get(team_code)
-
-            conn.execute(
-                """
-                INSERT INTO players (id, nfl_team_id, name, position, is_active)
-                VALUES (?, ?, ?, ?, ?)
-            """,
-                (player_id, nfl_team_id, player_name, position, 1),
-            )
+        player_ids = [_new_id() for _ in sample_players]
+        conn.executemany(
+            """
+            INSERT INTO players (id, nfl_team_id, name, position, is_active)
+            VALUES (?, ?, ?, ?, ?)
+        """,
+            [
+                (player_id, team_id_map.get(team_code), player_name, position, 1)
+                for player_id, (player_name, position, team_code) in zip(player_ids, sample_players)
+            ],
+        )
 
         # Insert some sample roster entries (assigning players to teams)
+        roster_entries = []
         for i, team_id in enumerate(team_ids):
             # Assign 1 QB, 2 RBs, 2 WRs, 1 TE, 1 K, 1 DEF to each team
             positions_needed = ["QB", "RB", "RB", "WR", "WR", "TE", "K", "DEF"]
@@ -200,25 +201,24 @@ def init_sample_data():
             for j, position in enumerate(positions_needed):
                 if player_index + j < len(player_ids):
                     player_id = player_ids[player_index + j]
-                    roster_entry_id = str(uuid.uuid4())
-
-                    # Get roster position ID
-                    cursor = conn.execute(
-                        "SELECT id FROM roster_positions WHERE position = ?", (position,)
-                    )
-                    roster_position_row = cursor.fetchone()
-                    if roster_position_row:
-                        roster_position_id = roster_position_row["id"]
-
-                        conn.execute(
-                            """
-                            INSERT INTO roster_entries (id, fantasy_team_id, player_id, roster_position_id, is_starting)
-                            VALUES (?, ?, ?, ?, ?)
-                        """,
-                            (roster_entry_id, team_id, player_id, roster_position_id, 1),
+                    roster_entry_id = _new_id()
+
+                    # Roster position IDs were generated above, no lookup needed
+                    roster_position_id = roster_position_ids.get(position)
+                    if roster_position_id:
+                        roster_entries.append(
+                            (roster_entry_id, team_id, player_id, roster_position_id, 1)
                         )
 
-        conn.commit()
+        conn.executemany(
+            """
+            INSERT INTO roster_entries
+                (id, fantasy_team_id, player_id, roster_position_id, is_starting)
+            VALUES (?, ?, ?, ?, ?)
+        """,
+            roster_entries,
+        )
+
         logger.info(
             f"Initialized database with {len(nfl_teams)} NFL teams, {len(sample_players)} players, and {len(fantasy_teams)} fantasy teams"
         )
@@ -3,13 +3,26 @@ FastAPI application for Fantasy Football Analysis
 """
 
 import os
+from collections.abc import AsyncIterator
+from itertools import groupby
+from operator import itemgetter
 
+import anyio
+import orjson
 import uvicorn
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
-from src.database import get_database_path, init_database
+from src.cache import clear_all_caches, ttl_cache
+from src.database import (
+    analyze_database,
+    execute_query,
+    get_database_path,
+    get_db_connection,
+    init_database,
+    rows_to_dicts,
+)
 from src.logging_config import get_logger
 
 # Initialize FastAPI app
@@ -17,6 +30,7 @@ app = FastAPI(
     title="Fantasy Football Analysis",
     description="A comprehensive fantasy football analysis platform",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Mount static files
@@ -25,17 +39,39 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 # Get logger for this module
 logger = get_logger(__name__)
 
+# Columns exposed by the API, selected explicitly instead of SELECT *
+FANTASY_TEAM_COLUMNS = "id, owner_name, team_name, wins, losses, ties, points_for, points_against"
+PLAYER_COLUMNS = (
+    "id, nfl_team_id, espn_id, name, position, jersey_number, height, weight, age, "
+    "experience_years, college, is_active, is_injured, injury_status"
+)
+ROSTER_PLAYER_COLUMNS = ", ".join(f"p.{column}" for column in PLAYER_COLUMNS.split(", "))
+
+# Every rostered player, grouped by fantasy team and in roster display order
+ROSTERS_QUERY = f"""
+SELECT re.fantasy_team_id, {ROSTER_PLAYER_COLUMNS},
+       re.is_starting, re.acquisition_type, re.acquired_date,
+       nt.team_name as nfl_team_name, nt.team_code as nfl_team_code
+FROM roster_entries re
+JOIN players p ON p.id = re.player_id
+LEFT JOIN nfl_teams nt ON p.nfl_team_id = nt.id
+ORDER BY re.fantasy_team_id, p.position_rank, re.is_starting DESC, p.name
+"""
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database on startup"""
+# Rows fetched per worker-thread call by streaming endpoints
+STREAM_BATCH_SIZE = 500
+
+# League data only changes when it is reloaded, so read endpoints can be cached briefly
+READ_CACHE_SECONDS = 30
+
+
+def initialize_data() -> None:
+    """Create the schema and load league data if the database is empty"""
     try:
         init_database()
         logger.info(f"Database initialized at: {get_database_path()}")
 
         # Initialize ESPN data if database is empty
-        from src.database import execute_query
-
         teams_count = execute_query("SELECT COUNT(*) as count FROM fantasy_teams")
         if teams_count[0]["count"] == 0:
             logger.info("Database is empty, initializing ESPN data...")
@@ -53,10 +89,21 @@ async def startup_event():
         else:
             logger.info("Database already contains data, skipping initialization.")
 
+        # Refresh planner statistics now that the tables are populated
+        analyze_database()
+        clear_all_caches()
+
     except Exception as e:
         logger.error(f"Error initializing database: {e}")
 
 
+@app.on_event("startup")
+async def startup_event():
+    """Initialize database on startup"""
+    # Data loading is blocking I/O, so keep it off the event loop
+    await anyio.to_thread.run_sync(initialize_data)
+
+
 @app.get("/")
 async def root():
     """Serve the main HTML page"""
@@ -70,84 +117,93 @@ async def health_check():
 
 
 @app.get("/api/teams")
-async def get_teams():
+@ttl_cache(READ_CACHE_SECONDS)
+def get_teams():
     """Get all fantasy teams"""
     try:
-        from src.database import execute_query
-
-        teams = execute_query("SELECT * FROM fantasy_teams ORDER BY team_name")
-        return {"teams": [dict(team) for team in teams]}
+        teams = execute_query(
+            f"SELECT {FANTASY_TEAM_COLUMNS} FROM fantasy_teams ORDER BY team_name"
+        )
+        return {"teams": rows_to_dicts(teams)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/players")
-async def get_players():
+@ttl_cache(READ_CACHE_SECONDS)
+def get_players():
     """Get all players"""
     try:
-        from src.database import execute_query
-
-        players = execute_query("SELECT * FROM players ORDER BY name")
-        return {"players": [dict(player) for player in players]}
+        players = execute_query(f"SELECT {PLAYER_COLUMNS} FROM players ORDER BY name")
+        return {"players": rows_to_dicts(players)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def iter_jsonl(query: str, params: tuple = ()) -> AsyncIterator[bytes]:
+    """
+    Yield result rows as newline-terminated JSON documents, one batch at a time
+
+    Each sqlite3 call, including opening and closing the connection, runs in a worker
+    thread so the event loop never blocks. Successive calls may land on different
+    threads, never two at once, so the connection is opened with check_same_thread=False.
+    """
+    connection = get_db_connection(check_same_thread=False)
+    conn = await anyio.to_thread.run_sync(connection.__enter__)
+    try:
+        cursor = await anyio.to_thread.run_sync(conn.execute, query, params)
+        columns = [column[0] for column in cursor.description]
+        while rows := await anyio.to_thread.run_sync(cursor.fetchmany, STREAM_BATCH_SIZE):
+            yield b"".join(orjson.dumps(dict(zip(columns, row))) + b"\n" for row in rows)
+    finally:
+        # Shielded so a cancelled stream still closes its connection
+        with anyio.CancelScope(shield=True):
+            await anyio.to_thread.run_sync(connection.__exit__, None, None, None)
+
+
+@app.get("/api/players/stream")
+def stream_players():
+    """Stream all players as newline-delimited JSON"""
+    return StreamingResponse(
+        iter_jsonl(f"SELECT {PLAYER_COLUMNS} FROM players ORDER BY name"),
+        media_type="application/x-ndjson",
+    )
+
+
 @app.get("/api/teams-with-players")
-async def get_teams_with_players():
+@ttl_cache(READ_CACHE_SECONDS)
+def get_teams_with_players():
     """Get all teams with their roster of players and stats"""
     try:
-        from src.database import execute_query
-
         # Get all teams
-        teams = execute_query("SELECT * FROM fantasy_teams ORDER BY points_for DESC")
-
-        teams_with_players = []
-        for team in teams:
-            team_dict = dict(team)
-
-            # Get players for this team from roster_entries
-            # First check if roster_entries has data
-            try:
-                players_query = """
-                SELECT p.*, re.is_starting, re.acquisition_type, re.acquired_date,
-                       nt.team_name as nfl_team_name, nt.team_code as nfl_team_code
-                FROM players p
-                LEFT JOIN roster_entries re ON p.id = re.player_id
-                LEFT JOIN nfl_teams nt ON p.nfl_team_id = nt.id
-                WHERE re.fantasy_team_id = ?
-                ORDER BY 
-                    CASE p.position 
-                        WHEN 'QB' THEN 1 
-                        WHEN 'RB' THEN 2 
-                        WHEN 'WR' THEN 3 
-                        WHEN 'TE' THEN 4 
-                        WHEN 'K' THEN 5 
-                        WHEN 'DEF' THEN 6 
-                        ELSE 7 
-                    END,
-                    re.is_starting DESC,
-                    p.name
-                """
-                players = execute_query(players_query, (team["id"],))
-                team_dict["players"] = [dict(player) for player in players]
-                team_dict["player_count"] = len(players)
-
-                # Calculate roster composition
+        teams = execute_query(
+            f"SELECT {FANTASY_TEAM_COLUMNS} FROM fantasy_teams ORDER BY points_for DESC"
+        )
+
+        teams_with_players = rows_to_dicts(teams)
+
+        # Load every roster in one query, then bucket the players by team and count
+        # each team's positions in the same pass
+        rosters = {}
+        try:
+            players = rows_to_dicts(execute_query(ROSTERS_QUERY))
+            for team_id, team_players in groupby(players, key=itemgetter("fantasy_team_id")):
+                player_dicts = []
                 positions = {}
-                for player in players:
-                    pos = player["position"]
+                for player_dict in team_players:
+                    player_dicts.append(player_dict)
+                    pos = player_dict["position"]
                     positions[pos] = positions.get(pos, 0) + 1
-                team_dict["roster_composition"] = positions
-
-            except Exception as e:
-                # If roster_entries doesn't exist or has issues, just return empty roster
-                logger.warning(f"Could not load roster for team {team['id']}: {e}")
-                team_dict["players"] = []
-                team_dict["player_count"] = 0
-                team_dict["roster_composition"] = {}
-
-            teams_with_players.append(team_dict)
+                rosters[team_id] = (player_dicts, positions)
+        except Exception as e:
+            # If roster_entries doesn't exist or has issues, just return empty rosters
+            logger.warning(f"Could not load rosters: {e}")
+
+        for team_dict in teams_with_players:
+            player_dicts, positions = rosters.get(team_dict["id"], ([], {}))
+            team_dict["players"] = player_dicts
+            team_dict["player_count"] = len(player_dicts)
+            team_dict["roster_composition"] = positions
 
         return {"teams": teams_with_players}
     except Exception as e:
@@ -5,10 +5,193 @@ These models represent the core entities in the fantasy football analysis system
 and provide type safety and validation for database operations with SQLite.
 """
 
-import uuid
-from dataclasses import dataclass, field
-from datetime import date, datetime
+import os
+import sys
+import time
+import types
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import MISSING, dataclass, field, fields
+from datetime import datetime
 from enum import Enum
+from functools import cache
+from operator import attrgetter
+from typing import Any, ClassVar, Self
+
+# Number of ids generated per os.urandom call
+_ID_BATCH_SIZE = 4096
+
+# Pre-generated ids handed out by _new_id
+_id_pool: list[str] = []
+
+# A forked child must not hand out the ids its parent already holds
+os.register_at_fork(after_in_child=_id_pool.clear)
+
+
+def _new_id() -> str:
+    """Return a new random UUID4 hex string, drawing from a batch generated in one syscall"""
+    # list.pop is atomic, so threads racing for the last id just refill and retry
+    while True:
+        try:
+            return _id_pool.pop()
+        except IndexError:
+            # Imported here so importing the models alone does not pay for uuid
+            import uuid
+
+            raw = os.urandom(16 * _ID_BATCH_SIZE)
+            _id_pool.extend(
+                uuid.UUID(bytes=raw[i : i + 16], version=4).hex for i in range(0, len(raw), 16)
+            )
+
+
+# Timestamps are re-formatted at most once per this many nanoseconds
+_TIMESTAMP_RESOLUTION_NS = 1_000_000
+
+_last_timestamp_ns = 0
+_last_timestamp = ""
+
+
+def _now_iso() -> str:
+    """Return the current local time as an ISO 8601 string, cached for up to 1 ms"""
+    global _last_timestamp_ns, _last_timestamp
+    now_ns = time.monotonic_ns()
+    if now_ns - _last_timestamp_ns >= _TIMESTAMP_RESOLUTION_NS or not _last_timestamp:
+        _last_timestamp = datetime.now().isoformat()
+        _last_timestamp_ns = now_ns
+    return _last_timestamp
+
+
+# Cleared by skip_validation() while constructing models from trusted data
+_validation_enabled: ContextVar[bool] = ContextVar("validation_enabled", default=True)
+
+
+@contextmanager
+def skip_validation() -> Iterator[None]:
+    """
+    Construct models without running __post_init__ validation
+
+    Intended for bulk hydration of rows that were validated when they were stored.
+    Enum-backed string fields are not normalized either, so values must already be
+    stored in their string form.
+    """
+    token = _validation_enabled.set(False)
+    try:
+        yield
+    finally:
+        _validation_enabled.reset(token)
+
+
+class DatabaseModel:
+    """Base class for models that are persisted as SQLite rows"""
+
+    __slots__ = ()
+
+    # Table the model is stored in; set by each subclass
+    table_name: ClassVar[str]
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> Self:
+        """
+        Build a model from a database row without running __init__ validation
+
+        Rows are trusted as stored, so this fast path only converts Enum columns and
+        interns low-cardinality string columns. Fields missing from the row get their
+        defaults, and an empty updated_at falls back to created_at.
+
+        Args:
+            row: sqlite3.Row or mapping keyed by column name
+
+        Returns:
+            Model instance populated from the row
+        """
+        obj = cls.__new__(cls)
+        for name, convert, default in _row_fields(cls):
+            try:
+                value = row[name]
+            except (KeyError, IndexError):  # sqlite3.Row raises IndexError
+                if default is None:
+                    raise KeyError(f"Row is missing required column '{name}'") from None
+                value = default()
+            else:
+                if convert is not None and value is not None:
+                    value = convert(value)
+            setattr(obj, name, value)
+        # Same fallback as __post_init__, which this fast path skips; models without
+        # an updated_at column have no such slot
+        if not getattr(obj, "updated_at", True):
+            obj.updated_at = obj.created_at
+        return obj
+
+    @classmethod
+    def column_names(cls) -> tuple[str, ...]:
+        """Database column names, in the order used by to_row_tuple"""
+        return _column_names(cls)
+
+    def to_row_tuple(self) -> tuple:
+        """Field values in column_names() order, with Enum members stored as their value"""
+        return _row_tuple_getter(type(self))(self)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Field values keyed by column name, with Enum members stored as their value
+
+        Cheaper than dataclasses.asdict, which deep-copies every field; model fields
+        are flat, so a shallow dict is equivalent.
+        """
+        return dict(zip(_column_names(type(self)), self.to_row_tuple()))
+
+
+@cache
+def _column_names(cls: type) -> tuple[str, ...]:
+    """Field names of a model, which match its table's column names"""
+    return tuple(f.name for f in fields(cls))
+
+
+@cache
+def _row_tuple_getter(cls: type) -> Callable[[Any], tuple]:
+    """Build the function that extracts a model's column values as a tuple"""
+    names = _column_names(cls)
+    get_values = attrgetter(*names)
+    enum_fields = [f for f in fields(cls) if _enum_type(f.type) is not None]
+    if not enum_fields:
+        return get_values
+
+    def get_row(obj: Any) -> tuple:
+        return tuple(value.value if isinstance(value, Enum) else value for value in get_values(obj))
+
+    return get_row
+
+
+def _enum_type(annotation: Any) -> type[Enum] | None:
+    """Return the Enum class of a field annotation such as Position or Position | None"""
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return annotation
+    if isinstance(annotation, types.UnionType):
+        for arg in annotation.__args__:
+            if isinstance(arg, type) and issubclass(arg, Enum):
+                return arg
+    return None
+
+
+@cache
+def _row_fields(
+    cls: type,
+) -> tuple[tuple[str, Callable[[Any], Any] | None, Callable[[], Any] | None], ...]:
+    """Per-model (name, converter, default) triples used by from_row"""
+    row_fields = []
+    for f in fields(cls):
+        convert = _enum_type(f.type)
+        if convert is None and f.name in _INTERNED_COLUMNS:
+            convert = sys.intern
+        if f.default is not MISSING:
+            default = lambda value=f.default: value  # noqa: E731
+        elif f.default_factory is not MISSING:
+            default = f.default_factory
+        else:
+            default = None
+        row_fields.append((f.name, convert, default))
+    return tuple(row_fields)
 
 
 class Position(Enum):
@@ -83,36 +266,101 @@ class GameStatus(Enum):
     FINAL = "Final"
 
 
-@dataclass
-class NFLTeam:
+# Low-cardinality string columns whose values are interned when loaded from rows,
+# so every row shares one string object per distinct value
+_INTERNED_COLUMNS = frozenset(
+    {
+        "position",
+        "conference",
+        "division",
+        "platform",
+        "scoring_type",
+        "game_status",
+        "acquisition_type",
+        "status",
+        "source",
+    }
+)
+
+# Pre-intern every Enum value so loaded rows resolve to the same objects
+for _enum in (
+    Position,
+    Conference,
+    Division,
+    ScoringType,
+    Platform,
+    AcquisitionType,
+    TradeStatus,
+    GameStatus,
+):
+    for _member in _enum:
+        sys.intern(_member.value)
+del _enum, _member
+
+# Valid string values for Enum-backed fields stored as plain str on hot models
+POSITION_VALUES = frozenset(position.value for position in Position)
+PLATFORM_VALUES = frozenset(platform.value for platform in Platform)
+SCORING_TYPE_VALUES = frozenset(scoring_type.value for scoring_type in ScoringType)
+GAME_STATUS_VALUES = frozenset(game_status.value for game_status in GameStatus)
+
+# Roster slots also include the bench, which is not a player position
+BENCH_POSITION = "BN"
+ROSTER_POSITION_VALUES = POSITION_VALUES | {BENCH_POSITION}
+
+
+def _check_optional_range(value: float | None, low: float, high: float, message: str) -> None:
+    """Raise ValueError with message if an optional value is set and outside [low, high]"""
+    if value is not None and not low <= value <= high:
+        raise ValueError(message)
+
+
+def _choice_value(value: Enum | str, choices: frozenset[str], label: str) -> str:
+    """Normalize an Enum member or string to its string value and validate it"""
+    if isinstance(value, Enum):
+        value = value.value
+    if value not in choices:
+        raise ValueError(f"Invalid {label}: {value}")
+    return value
+
+
+@dataclass(slots=True)
+class NFLTeam(DatabaseModel):
     """NFL team model"""
 
+    table_name: ClassVar[str] = "nfl_teams"
+
     team_code: str
     team_name: str
     city: str
     conference: Conference
     division: Division
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    id: str = field(default_factory=_new_id)
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = ""  # Filled from created_at in __post_init__
 
     def __post_init__(self) -> None:
         """Validate team data"""
-        if not self.team_code or len(self.team_code) > 3:
+        if not self.updated_at:
+            self.updated_at = self.created_at
+        if not _validation_enabled.get():
+            return
+        if not 1 <= len(self.team_code or "") <= 3:
             raise ValueError("Team code must be 1-3 characters")
-        if not self.team_name or len(self.team_name) > 50:
+        if not 1 <= len(self.team_name or "") <= 50:
             raise ValueError("Team name must be 1-50 characters")
-        if not self.city or len(self.city) > 30:
+        if not 1 <= len(self.city or "") <= 30:
             raise ValueError("City must be 1-30 characters")
 
 
-@dataclass
-class Player:
+@dataclass(slots=True)
+class Player(DatabaseModel):
     """Player model"""
 
+    table_name: ClassVar[str] = "players"
+
     name: str
-    position: Position
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    position: str  # Position value
+    id: str = field(default_factory=_new_id)
     nfl_team_id: str | None = None
     espn_id: str | None = None
     jersey_number: int | None = None
@@ -124,74 +372,85 @@ class Player:
     is_active: int = 1  # SQLite boolean as integer
     is_injured: int = 0  # SQLite boolean as integer
     injury_status: str | None = None
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = ""  # Filled from created_at in __post_init__
 
     def __post_init__(self) -> None:
         """Validate player data"""
-        if not self.name or len(self.name) > 100:
+        if not self.updated_at:
+            self.updated_at = self.created_at
+        if not _validation_enabled.get():
+            return
+        if not 1 <= len(self.name or "") <= 100:
             raise ValueError("Player name must be 1-100 characters")
-        if self.jersey_number is not None and (self.jersey_number < 0 or self.jersey_number > 99):
-            raise ValueError("Jersey number must be 0-99")
-        if self.weight is not None and (self.weight < 100 or self.weight > 400):
-            raise ValueError("Weight must be 100-400 pounds")
-        if self.age is not None and (self.age < 18 or self.age > 50):
-            raise ValueError("Age must be 18-50")
-        if self.experience_years is not None and (
-            self.experience_years < 0 or self.experience_years > 25
-        ):
-            raise ValueError("Experience years must be 0-25")
+        self.position = _choice_value(self.position, POSITION_VALUES, "position")
+        _check_optional_range(self.jersey_number, 0, 99, "Jersey number must be 0-99")
+        _check_optional_range(self.weight, 100, 400, "Weight must be 100-400 pounds")
+        _check_optional_range(self.age, 18, 50, "Age must be 18-50")
+        _check_optional_range(self.experience_years, 0, 25, "Experience years must be 0-25")
 
 
-@dataclass
-class LeagueConfig:
+@dataclass(slots=True)
+class LeagueConfig(DatabaseModel):
     """League configuration model"""
 
+    table_name: ClassVar[str] = "league_config"
+
     league_name: str
-    platform: Platform
+    platform: str  # Platform value
     season_year: int
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     platform_league_id: str | None = None
-    scoring_type: ScoringType = ScoringType.PPR
+    scoring_type: str = ScoringType.PPR.value
     team_count: int | None = None
     playoff_teams: int | None = None
     is_active: int = 1  # SQLite boolean as integer
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = ""  # Filled from created_at in __post_init__
 
     def __post_init__(self) -> None:
         """Validate league config data"""
-        if not self.league_name or len(self.league_name) > 100:
+        if not self.updated_at:
+            self.updated_at = self.created_at
+        if not _validation_enabled.get():
+            return
+        if not 1 <= len(self.league_name or "") <= 100:
             raise ValueError("League name must be 1-100 characters")
-        if self.season_year < 2000 or self.season_year > 2030:
+        self.platform = _choice_value(self.platform, PLATFORM_VALUES, "platform")
+        self.scoring_type = _choice_value(self.scoring_type, SCORING_TYPE_VALUES, "scoring type")
+        if not 2000 <= self.season_year <= 2030:
             raise ValueError("Season year must be 2000-2030")
-        if self.team_count is not None and (self.team_count < 2 or self.team_count > 32):
-            raise ValueError("Team count must be 2-32")
-        if self.playoff_teams is not None and (self.playoff_teams < 2 or self.playoff_teams > 16):
-            raise ValueError("Playoff teams must be 2-16")
+        _check_optional_range(self.team_count, 2, 32, "Team count must be 2-32")
+        _check_optional_range(self.playoff_teams, 2, 16, "Playoff teams must be 2-16")
 
 
-@dataclass
-class FantasyTeam:
+@dataclass(slots=True)
+class FantasyTeam(DatabaseModel):
     """Fantasy team model"""
 
+    table_name: ClassVar[str] = "fantasy_teams"
+
     owner_name: str
     team_name: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     platform_team_id: str | None = None
     wins: int = 0
     losses: int = 0
     ties: int = 0
     points_for: float = 0.0
     points_against: float = 0.0
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = ""  # Filled from created_at in __post_init__
 
     def __post_init__(self) -> None:
         """Validate fantasy team data"""
-        if not self.owner_name or len(self.owner_name) > 100:
+        if not self.updated_at:
+            self.updated_at = self.created_at
+        if not _validation_enabled.get():
+            return
+        if not 1 <= len(self.owner_name or "") <= 100:
             raise ValueError("Owner name must be 1-100 characters")
-        if not self.team_name or len(self.team_name) > 100:
+        if not 1 <= len(self.team_name or "") <= 100:
             raise ValueError("Team name must be 1-100 characters")
         if self.wins < 0 or self.losses < 0 or self.ties < 0:
             raise ValueError("Record values must be non-negative")
@@ -199,58 +458,77 @@ class FantasyTeam:
             raise ValueError("Points values must be non-negative")
 
 
-@dataclass
-class RosterPosition:
+@dataclass(slots=True)
+class RosterPosition(DatabaseModel):
     """Roster position model"""
 
-    position: Position
+    table_name: ClassVar[str] = "roster_positions"
+
+    position: str  # Position value or BENCH_POSITION
     count: int
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     is_bench: int = 0  # SQLite boolean as integer
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
 
     def __post_init__(self) -> None:
         """Validate roster position data"""
-        if self.count < 0 or self.count > 10:
+        if not _validation_enabled.get():
+            return
+        self.position = _choice_value(self.position, ROSTER_POSITION_VALUES, "roster position")
+        if not 0 <= self.count <= 10:
             raise ValueError("Position count must be 0-10")
 
 
-@dataclass
-class RosterEntry:
+@dataclass(slots=True)
+class RosterEntry(DatabaseModel):
     """Roster entry model"""
 
+    table_name: ClassVar[str] = "roster_entries"
+
     fantasy_team_id: str
     player_id: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     roster_position_id: str | None = None
     is_starting: int = 0  # SQLite boolean as integer
     acquired_date: str | None = None  # SQLite date as string
     acquisition_type: AcquisitionType | None = None
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = ""  # Filled from created_at in __post_init__
+
+    def __post_init__(self) -> None:
+        """Default updated_at to created_at"""
+        if not self.updated_at:
+            self.updated_at = self.created_at
 
 
-@dataclass
-class NFLGame:
+@dataclass(slots=True)
+class NFLGame(DatabaseModel):
     """NFL game model"""
 
+    table_name: ClassVar[str] = "nfl_games"
+
     season_year: int
     week: int
     home_team_id: str
     away_team_id: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     game_date: str | None = None  # SQLite datetime as string
     home_score: int | None = None
     away_score: int | None = None
-    game_status: GameStatus = GameStatus.SCHEDULED
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    game_status: str = GameStatus.SCHEDULED.value
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = ""  # Filled from created_at in __post_init__
 
     def __post_init__(self) -> None:
         """Validate NFL game data"""
-        if self.season_year < 2000 or self.season_year > 2030:
+        if not self.updated_at:
+            self.updated_at = self.created_at
+        if not _validation_enabled.get():
+            return
+        self.game_status = _choice_value(self.game_status, GAME_STATUS_VALUES, "game status")
+        if not 2000 <= self.season_year <= 2030:
             raise ValueError("Season year must be 2000-2030")
-        if self.week < 1 or self.week > 21:
+        if not 1 <= self.week <= 21:
             raise ValueError("Week must be 1-21")
         if self.home_score is not None and self.home_score < 0:
             raise ValueError("Home score must be non-negative")
@@ -258,13 +536,15 @@ class NFLGame:
             raise ValueError("Away score must be non-negative")
 
 
-@dataclass
-class PlayerGameStats:
+@dataclass(slots=True)
+class PlayerGameStats(DatabaseModel):
     """Player game statistics model"""
 
+    table_name: ClassVar[str] = "player_game_stats"
+
     player_id: str
     nfl_game_id: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     passing_yards: int = 0
     passing_touchdowns: int = 0
     passing_interceptions: int = 0
@@ -280,14 +560,17 @@ class PlayerGameStats:
     extra_points_made: int = 0
     extra_points_attempted: int = 0
     fantasy_points: float = 0.0
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = ""  # Filled from created_at in __post_init__
 
     def __post_init__(self) -> None:
         """Validate player game stats"""
-        if any(
-            value < 0
-            for value in [
+        if not self.updated_at:
+            self.updated_at = self.created_at
+        if not _validation_enabled.get():
+            return
+        if (
+            min(
                 self.passing_yards,
                 self.passing_touchdowns,
                 self.passing_interceptions,
@@ -302,20 +585,23 @@ class PlayerGameStats:
                 self.field_goals_attempted,
                 self.extra_points_made,
                 self.extra_points_attempted,
-            ]
+            )
+            < 0
         ):
             raise ValueError("All stat values must be non-negative")
         if self.fantasy_points < 0:
             raise ValueError("Fantasy points must be non-negative")
 
 
-@dataclass
-class TeamDefenseGameStats:
+@dataclass(slots=True)
+class TeamDefenseGameStats(DatabaseModel):
     """Team defense game statistics model"""
 
+    table_name: ClassVar[str] = "team_defense_game_stats"
+
     nfl_team_id: str
     nfl_game_id: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     sacks: int = 0
     interceptions: int = 0
     fumbles_recovered: int = 0
@@ -324,14 +610,17 @@ class TeamDefenseGameStats:
     points_allowed: int = 0
     yards_allowed: int = 0
     fantasy_points: float = 0.0
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = ""  # Filled from created_at in __post_init__
 
     def __post_init__(self) -> None:
         """Validate team defense game stats"""
-        if any(
-            value < 0
-            for value in [
+        if not self.updated_at:
+            self.updated_at = self.created_at
+        if not _validation_enabled.get():
+            return
+        if (
+            min(
                 self.sacks,
                 self.interceptions,
                 self.fumbles_recovered,
@@ -339,66 +628,81 @@ class TeamDefenseGameStats:
                 self.touchdowns,
                 self.points_allowed,
                 self.yards_allowed,
-            ]
+            )
+            < 0
         ):
             raise ValueError("All stat values must be non-negative")
         if self.fantasy_points < 0:
             raise ValueError("Fantasy points must be non-negative")
 
 
-@dataclass
-class FantasyMatchup:
+@dataclass(slots=True)
+class FantasyMatchup(DatabaseModel):
     """Fantasy matchup model"""
 
+    table_name: ClassVar[str] = "fantasy_matchups"
+
     week: int
     home_team_id: str
     away_team_id: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     home_score: float = 0.0
     away_score: float = 0.0
     winner_id: str | None = None
     is_playoff: int = 0  # SQLite boolean as integer
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = ""  # Filled from created_at in __post_init__
 
     def __post_init__(self) -> None:
         """Validate fantasy matchup data"""
-        if self.week < 1 or self.week > 21:
+        if not self.updated_at:
+            self.updated_at = self.created_at
+        if not _validation_enabled.get():
+            return
+        if not 1 <= self.week <= 21:
             raise ValueError("Week must be 1-21")
         if self.home_score < 0 or self.away_score < 0:
             raise ValueError("Scores must be non-negative")
 
 
-@dataclass
-class FantasyTeamWeeklyScore:
+@dataclass(slots=True)
+class FantasyTeamWeeklyScore(DatabaseModel):
     """Fantasy team weekly score model"""
 
+    table_name: ClassVar[str] = "fantasy_team_weekly_scores"
+
     fantasy_team_id: str
     week: int
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     total_score: float = 0.0
     bench_score: float = 0.0
     optimal_score: float = 0.0
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = ""  # Filled from created_at in __post_init__
 
     def __post_init__(self) -> None:
         """Validate fantasy team weekly score data"""
-        if self.week < 1 or self.week > 21:
+        if not self.updated_at:
+            self.updated_at = self.created_at
+        if not _validation_enabled.get():
+            return
+        if not 1 <= self.week <= 21:
             raise ValueError("Week must be 1-21")
-        if any(score < 0 for score in [self.total_score, self.bench_score, self.optimal_score]):
+        if min(self.total_score, self.bench_score, self.optimal_score) < 0:
             raise ValueError("All scores must be non-negative")
 
 
-@dataclass
-class PlayerProjection:
+@dataclass(slots=True)
+class PlayerProjection(DatabaseModel):
     """Player projection model"""
 
+    table_name: ClassVar[str] = "player_projections"
+
     player_id: str
     week: int
     season_year: int
     source: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     projected_fantasy_points: float | None = None
     projected_passing_yards: int | None = None
     projected_passing_touchdowns: int | None = None
@@ -408,45 +712,49 @@ class PlayerProjection:
     projected_receiving_touchdowns: int | None = None
     projected_receptions: int | None = None
     confidence_rating: int | None = None
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = ""  # Filled from created_at in __post_init__
 
     def __post_init__(self) -> None:
         """Validate player projection data"""
-        if self.week < 1 or self.week > 21:
+        if not self.updated_at:
+            self.updated_at = self.created_at
+        if not _validation_enabled.get():
+            return
+        if not 1 <= self.week <= 21:
             raise ValueError("Week must be 1-21")
-        if self.season_year < 2000 or self.season_year > 2030:
+        if not 2000 <= self.season_year <= 2030:
             raise ValueError("Season year must be 2000-2030")
-        if not self.source or len(self.source) > 50:
+        if not 1 <= len(self.source or "") <= 50:
             raise ValueError("Source must be 1-50 characters")
-        if self.confidence_rating is not None and (
-            self.confidence_rating < 1 or self.confidence_rating > 10
-        ):
-            raise ValueError("Confidence rating must be 1-10")
+        _check_optional_range(self.confidence_rating, 1, 10, "Confidence rating must be 1-10")
 
 
-@dataclass
-class PlayerRanking:
+@dataclass(slots=True)
+class PlayerRanking(DatabaseModel):
     """Player ranking model"""
 
+    table_name: ClassVar[str] = "player_rankings"
+
     player_id: str
-    position: Position
+    position: str  # Position value
     source: str
     rank: int
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     week: int | None = None
     season_year: int | None = None
     tier: int | None = None
     notes: str | None = None
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
 
     def __post_init__(self) -> None:
         """Validate player ranking data"""
-        if self.week is not None and (self.week < 1 or self.week > 21):
-            raise ValueError("Week must be 1-21")
-        if self.season_year is not None and (self.season_year < 2000 or self.season_year > 2030):
-            raise ValueError("Season year must be 2000-2030")
-        if not self.source or len(self.source) > 50:
+        if not _validation_enabled.get():
+            return
+        self.position = _choice_value(self.position, POSITION_VALUES, "position")
+        _check_optional_range(self.week, 1, 21, "Week must be 1-21")
+        _check_optional_range(self.season_year, 2000, 2030, "Season year must be 2000-2030")
+        if not 1 <= len(self.source or "") <= 50:
             raise ValueError("Source must be 1-50 characters")
         if self.rank < 1:
             raise ValueError("Rank must be positive")
@@ -454,108 +762,125 @@ class PlayerRanking:
             raise ValueError("Tier must be positive")
 
 
-@dataclass
-class TradeProposal:
+@dataclass(slots=True)
+class TradeProposal(DatabaseModel):
     """Trade proposal model"""
 
+    table_name: ClassVar[str] = "trade_proposals"
+
     proposing_team_id: str
     receiving_team_id: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     status: TradeStatus = TradeStatus.PENDING
-    proposed_date: str = field(default_factory=lambda: datetime.now().isoformat())
+    proposed_date: str = field(default_factory=_now_iso)
     response_date: str | None = None
     notes: str | None = None
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = ""  # Filled from created_at in __post_init__
+
+    def __post_init__(self) -> None:
+        """Default updated_at to created_at"""
+        if not self.updated_at:
+            self.updated_at = self.created_at
 
 
-@dataclass
-class TradeItem:
+@dataclass(slots=True)
+class TradeItem(DatabaseModel):
     """Trade item model"""
 
+    table_name: ClassVar[str] = "trade_items"
+
     trade_proposal_id: str
     team_id: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     player_id: str | None = None
     draft_round: int | None = None
     draft_pick_year: int | None = None
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
 
     def __post_init__(self) -> None:
         """Validate trade item data"""
+        if not _validation_enabled.get():
+            return
         if self.player_id is None and (self.draft_round is None or self.draft_pick_year is None):
             raise ValueError("Must specify either player_id or draft pick details")
-        if self.draft_round is not None and (self.draft_round < 1 or self.draft_round > 20):
-            raise ValueError("Draft round must be 1-20")
-        if self.draft_pick_year is not None and (
-            self.draft_pick_year < 2000 or self.draft_pick_year > 2030
-        ):
-            raise ValueError("Draft pick year must be 2000-2030")
+        _check_optional_range(self.draft_round, 1, 20, "Draft round must be 1-20")
+        _check_optional_range(self.draft_pick_year, 2000, 2030, "Draft pick year must be 2000-2030")
 
 
-@dataclass
-class TradeAnalysis:
+@dataclass(slots=True)
+class TradeAnalysis(DatabaseModel):
     """Trade analysis model"""
 
+    table_name: ClassVar[str] = "trade_analysis"
+
     trade_proposal_id: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     team_a_value: float | None = None
     team_b_value: float | None = None
     team_a_roster_improvement: float | None = None
     team_b_roster_improvement: float | None = None
     analysis_notes: str | None = None
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
 
     def __post_init__(self) -> None:
         """Validate trade analysis data"""
-        if self.team_a_roster_improvement is not None and (
-            self.team_a_roster_improvement < -100 or self.team_a_roster_improvement > 100
-        ):
-            raise ValueError("Roster improvement must be -100 to 100")
-        if self.team_b_roster_improvement is not None and (
-            self.team_b_roster_improvement < -100 or self.team_b_roster_improvement > 100
-        ):
-            raise ValueError("Roster improvement must be -100 to 100")
-
-
-@dataclass
-class WaiverPriority:
+        if not _validation_enabled.get():
+            return
+        _check_optional_range(
+            self.team_a_roster_improvement, -100, 100, "Roster improvement must be -100 to 100"
+        )
+        _check_optional_range(
+            self.team_b_roster_improvement, -100, 100, "Roster improvement must be -100 to 100"
+        )
+
+
+@dataclass(slots=True)
+class WaiverPriority(DatabaseModel):
     """Waiver priority model"""
 
+    table_name: ClassVar[str] = "waiver_priorities"
+
     fantasy_team_id: str
     priority_order: int
     season_year: int
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    id: str = field(default_factory=_new_id)
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = ""  # Filled from created_at in __post_init__
 
     def __post_init__(self) -> None:
         """Validate waiver priority data"""
+        if not self.updated_at:
+            self.updated_at = self.created_at
+        if not _validation_enabled.get():
+            return
         if self.priority_order < 1:
             raise ValueError("Priority order must be positive")
-        if self.season_year < 2000 or self.season_year > 2030:
+        if not 2000 <= self.season_year <= 2030:
             raise ValueError("Season year must be 2000-2030")
 
 
-@dataclass
-class FreeAgentRecommendation:
+@dataclass(slots=True)
+class FreeAgentRecommendation(DatabaseModel):
     """Free agent recommendation model"""
 
+    table_name: ClassVar[str] = "free_agent_recommendations"
+
     player_id: str
     week: int
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     recommendation_reason: str | None = None
     priority_level: int | None = None
     projected_roster_impact: float | None = None
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
 
     def __post_init__(self) -> None:
         """Validate free agent recommendation data"""
-        if self.week < 1 or self.week > 21:
+        if not _validation_enabled.get():
+            return
+        if not 1 <= self.week <= 21:
             raise ValueError("Week must be 1-21")
-        if self.priority_level is not None and (self.priority_level < 1 or self.priority_level > 5):
-            raise ValueError("Priority level must be 1-5")
-        if self.projected_roster_impact is not None and (
-            self.projected_roster_impact < -100 or self.projected_roster_impact > 100
-        ):
-            raise ValueError("Projected roster impact must be -100 to 100")
+        _check_optional_range(self.priority_level, 1, 5, "Priority level must be 1-5")
+        _check_optional_range(
+            self.projected_roster_impact, -100, 100, "Projected roster impact must be -100 to 100"
+        )
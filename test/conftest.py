@@ -1,3 +1,68 @@
 """
 Pytest configuration and fixtures for the test suite.
 """
+
+import sqlite3
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from src.database import init_database
+
+# Attributes of a healthy, active ESPN player, as read by the adapter
+ESPN_PLAYER_DEFAULTS = {
+    "playerId": "1",
+    "name": "Patrick Mahomes",
+    "position": "QB",
+    "proTeamId": "KC",
+    "jersey": 15,
+    "height": "6-3",
+    "weight": 225,
+    "age": 28,
+    "experience": 6,
+    "college": "Texas Tech",
+    "injured": False,
+    "injuryStatus": "ACTIVE",
+    "active": True,
+    "acquisitionType": "DRAFT",
+}
+
+
+@pytest.fixture(scope="session")
+def template_database(tmp_path_factory):
+    """Create an initialized database once per session for tests to copy"""
+    template_path = str(tmp_path_factory.mktemp("template") / "template.db")
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("SQLITE_DB_PATH", template_path)
+        init_database()
+
+    return template_path
+
+
+@pytest.fixture
+def temp_database(template_database, monkeypatch):
+    """Create a temporary in-memory database for testing"""
+    # A uniquely named shared-cache database, visible to every connection the test opens
+    temp_db_uri = f"file:test_{uuid.uuid4().hex}?mode=memory&cache=shared"
+
+    # Set environment variable for the test database
+    monkeypatch.setenv("SQLITE_DB_PATH", temp_db_uri)
+
+    # The database only lives while a connection is open, so hold one for the whole
+    # test and copy the initialized template into it instead of re-running the schema
+    keepalive = sqlite3.connect(temp_db_uri, uri=True)
+    template = sqlite3.connect(template_database)
+    template.backup(keepalive)
+    template.close()
+
+    yield temp_db_uri
+
+    # Cleanup
+    keepalive.close()
+
+
+@pytest.fixture(scope="session")
+def make_espn_player():
+    """Factory for lightweight ESPN player objects, with per-test attribute overrides"""
+    return lambda **overrides: SimpleNamespace(**{**ESPN_PLAYER_DEFAULTS, **overrides})
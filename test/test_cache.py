@@ -0,0 +1,57 @@
+"""
+Tests for the in-process TTL cache
+"""
+
+from unittest.mock import patch
+
+import pytest
+from src.cache import clear_all_caches, ttl_cache
+
+
+def test_ttl_cache_reuses_value_until_expiry():
+    """Test that the cached value is reused until the TTL elapses"""
+    calls = []
+
+    @ttl_cache(30)
+    def load():
+        calls.append(1)
+        return len(calls)
+
+    with patch("src.cache.time.monotonic", return_value=100.0):
+        assert load() == 1
+        assert load() == 1
+
+    with patch("src.cache.time.monotonic", return_value=131.0):
+        assert load() == 2
+
+    assert len(calls) == 2
+
+
+def test_ttl_cache_does_not_cache_exceptions():
+    """Test that a failing call is retried on the next request"""
+    results = [RuntimeError("boom"), "ok"]
+
+    @ttl_cache(30)
+    def load():
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    with pytest.raises(RuntimeError, match="boom"):
+        load()
+    assert load() == "ok"
+
+
+def test_clear_all_caches():
+    """Test that clear_all_caches invalidates every cached function"""
+    calls = []
+
+    @ttl_cache(30)
+    def load():
+        calls.append(1)
+        return len(calls)
+
+    assert load() == 1
+    clear_all_caches()
+    assert load() == 2
@@ -4,16 +4,12 @@ Comprehensive test suite for database operations
 Tests cover:
 - Database initialization and schema
 - CRUD operations for all models
-- Data validation and constraints
 - Error handling and edge cases
 - Connection management
 """
 
 import os
-import shutil
 import sqlite3
-import tempfile
-from datetime import datetime
 
 import pytest
 from src.database import (
@@ -24,49 +20,9 @@ from src.database import (
     get_database_path,
     get_db_connection,
     init_database,
+    insert_models,
 )
-from src.logging_config import get_logger
-from src.models import (
-    Conference,
-    Division,
-    FantasyMatchup,
-    FantasyTeam,
-    LeagueConfig,
-    NFLTeam,
-    Platform,
-    Player,
-    Position,
-    RosterEntry,
-    RosterPosition,
-    ScoringType,
-)
-
-logger = get_logger(__name__)
-
-
-@pytest.fixture
-def temp_database():
-    """Create a temporary database for testing"""
-    # Create a temporary directory
-    temp_dir = tempfile.mkdtemp()
-    temp_db_path = os.path.join(temp_dir, "test_fantasy_football.db")
-
-    # Set environment variable for the test database
-    original_db_path = os.getenv("SQLITE_DB_PATH")
-    os.environ["SQLITE_DB_PATH"] = temp_db_path
-
-    # Initialize the test database
-    init_database()
-
-    yield temp_db_path
-
-    # Cleanup
-    if original_db_path:
-        os.environ["SQLITE_DB_PATH"] = original_db_path
-    else:
-        del os.environ["SQLITE_DB_PATH"]
-
-    shutil.rmtree(temp_dir)
+from src.models import FantasyTeam, LeagueConfig, Player, RosterEntry
 
 
 class TestDatabaseInitialization:
@@ -74,10 +30,10 @@ class TestDatabaseInitialization:
 
     def test_database_creation(self, temp_database):
         """Test that database is created with correct schema"""
-        # The database should be created by the fixture
-        assert os.path.exists(temp_database)
-
         with get_db_connection() as conn:
+            # The fixture's database lives in memory, so it has no backing file
+            assert conn.execute("PRAGMA database_list").fetchone()["file"] == ""
+
             # Check that all tables exist
             tables = [
                 "league_config",
@@ -100,11 +56,37 @@ class TestDatabaseInitialization:
                 "free_agent_recommendations",
             ]
 
-            for table in tables:
-                result = conn.execute(
-                    "SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table,)
-                )
-                assert result.fetchone() is not None, f"Table {table} not found"
+            rows = conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+            missing = set(tables) - {row["name"] for row in rows}
+            assert not missing, f"Tables not found: {sorted(missing)}"
+
+    def test_init_database_replaces_obsolete_indexes(self, temp_database):
+        """Test that re-initializing an older database swaps in the renamed indexes"""
+        with get_db_connection() as conn:
+            # Recreate the roster index as databases created before its rename have it
+            conn.execute("DROP INDEX idx_roster_entries_team_starting")
+            conn.execute("CREATE INDEX idx_roster_entries_team ON roster_entries(fantasy_team_id)")
+            conn.commit()
+
+        init_database()
+
+        with get_db_connection() as conn:
+            indexes = {row["name"] for row in conn.execute("PRAGMA index_list(roster_entries)")}
+            assert "idx_roster_entries_team" not in indexes
+            columns = conn.execute("PRAGMA index_xinfo(idx_roster_entries_team_starting)")
+            assert [(row["name"], row["desc"]) for row in columns if row["key"]] == [
+                ("fantasy_team_id", 0),
+                ("is_starting", 1),
+            ]
+
+    def test_players_position_rank(self, temp_database):
+        """Test that players sort into roster display order by position_rank"""
+        positions = ["K", "WR", "DEF", "QB", "FLEX", "TE", "RB"]
+        with get_db_connection() as conn:
+            insert_models(conn, [Player(name=pos, position=pos) for pos in positions])
+            rows = conn.execute("SELECT position FROM players ORDER BY position_rank").fetchall()
+
+        assert [row["position"] for row in rows] == ["QB", "RB", "WR", "TE", "K", "DEF", "FLEX"]
 
     def test_database_path_configuration(self):
         """Test database path configuration"""
@@ -121,292 +103,112 @@ class TestDatabaseInitialization:
             row = result.fetchone()
             assert row["test"] == 1
 
+    def test_in_memory_uri_database(self, monkeypatch):
+        """Test that a shared-cache in-memory URI works as the database path"""
+        db_uri = "file:test_in_memory_uri?mode=memory&cache=shared"
+        monkeypatch.setenv("SQLITE_DB_PATH", db_uri)
 
-class TestCRUDOperations:
-    """Test Create, Read, Update, Delete operations"""
-
-    def test_league_config_crud(self, temp_database):
-        """Test CRUD operations for LeagueConfig"""
-        with get_db_connection() as conn:
-            # Create
-            league_config = LeagueConfig(
-                league_name="Test League",
-                platform="ESPN",
-                season_year=2024,
-                platform_league_id="12345",
-                scoring_type="PPR",
-                team_count=12,
-                playoff_teams=6,
-            )
-
-            conn.execute(
-                """
-                INSERT INTO league_config (id, league_name, platform, platform_league_id, season_year, scoring_type, team_count, playoff_teams)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    league_config.id,
-                    league_config.league_name,
-                    league_config.platform,
-                    league_config.platform_league_id,
-                    league_config.season_year,
-                    league_config.scoring_type,
-                    league_config.team_count,
-                    league_config.playoff_teams,
-                ),
-            )
-
-            # Read
-            result = conn.execute("SELECT * FROM league_config WHERE id = ?", (league_config.id,))
-            row = result.fetchone()
-            assert row is not None
-            assert row["league_name"] == "Test League"
-            assert row["platform"] == "ESPN"
-
-            # Update
-            conn.execute(
-                "UPDATE league_config SET league_name = ? WHERE id = ?",
-                ("Updated Test League", league_config.id),
+        # A shared in-memory database lives only while a connection to it is open
+        keepalive = sqlite3.connect(db_uri, uri=True)
+        try:
+            init_database()
+            execute_insert(
+                "INSERT INTO fantasy_teams (id, owner_name, team_name) VALUES (?, ?, ?)",
+                ("team-1", "Test Owner", "Test Team"),
             )
 
-            result = conn.execute(
-                "SELECT league_name FROM league_config WHERE id = ?", (league_config.id,)
-            )
-            row = result.fetchone()
-            assert row["league_name"] == "Updated Test League"
+            rows = execute_query("SELECT team_name FROM fantasy_teams")
+            assert [row["team_name"] for row in rows] == ["Test Team"]
+            assert not os.path.exists(db_uri)
+        finally:
+            keepalive.close()
 
-            # Delete
-            conn.execute("DELETE FROM league_config WHERE id = ?", (league_config.id,))
 
-            result = conn.execute(
-                "SELECT COUNT(*) as count FROM league_config WHERE id = ?", (league_config.id,)
-            )
-            assert result.fetchone()["count"] == 0
-
-    def test_fantasy_team_crud(self, temp_database):
-        """Test CRUD operations for FantasyTeam"""
-        with get_db_connection() as conn:
-            # Create
-            team = FantasyTeam(
-                owner_name="Test Owner",
-                team_name="Test Team",
-                platform_team_id="123",
-                wins=8,
-                losses=5,
-                ties=0,
-                points_for=1200.5,
-                points_against=1150.2,
-            )
+class TestCRUDOperations:
+    """Test Create, Read, Update, Delete operations"""
 
-            conn.execute(
-                """
-                INSERT INTO fantasy_teams (id, owner_name, team_name, platform_team_id, wins, losses, ties, points_for, points_against)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    team.id,
-                    team.owner_name,
-                    team.team_name,
-                    team.platform_team_id,
-                    team.wins,
-                    team.losses,
-                    team.ties,
-                    team.points_for,
-                    team.points_against,
+    @pytest.mark.parametrize(
+        "model, expected, update",
+        [
+            pytest.param(
+                LeagueConfig(
+                    league_name="Test League",
+                    platform="ESPN",
+                    season_year=2024,
+                    platform_league_id="12345",
+                    scoring_type="PPR",
+                    team_count=12,
+                    playoff_teams=6,
                 ),
-            )
-
-            # Read
-            result = conn.execute("SELECT * FROM fantasy_teams WHERE id = ?", (team.id,))
-            row = result.fetchone()
-            assert row is not None
-            assert row["team_name"] == "Test Team"
-            assert row["owner_name"] == "Test Owner"
-            assert row["wins"] == 8
-            assert row["losses"] == 5
-
-            # Update
-            conn.execute("UPDATE fantasy_teams SET wins = ? WHERE id = ?", (9, team.id))
-
-            result = conn.execute("SELECT wins FROM fantasy_teams WHERE id = ?", (team.id,))
-            row = result.fetchone()
-            assert row["wins"] == 9
-
-            # Delete
-            conn.execute("DELETE FROM fantasy_teams WHERE id = ?", (team.id,))
-
-            result = conn.execute(
-                "SELECT COUNT(*) as count FROM fantasy_teams WHERE id = ?", (team.id,)
-            )
-            assert result.fetchone()["count"] == 0
-
-    def test_player_crud(self, temp_database):
-        """Test CRUD operations for Player"""
+                {"league_name": "Test League", "platform": "ESPN"},
+                ("league_name", "Updated Test League"),
+                id="league_config",
+            ),
+            pytest.param(
+                FantasyTeam(
+                    owner_name="Test Owner",
+                    team_name="Test Team",
+                    platform_team_id="123",
+                    wins=8,
+                    losses=5,
+                    ties=0,
+                    points_for=1200.5,
+                    points_against=1150.2,
+                ),
+                {"team_name": "Test Team", "owner_name": "Test Owner", "wins": 8, "losses": 5},
+                ("wins", 9),
+                id="fantasy_team",
+            ),
+            pytest.param(
+                Player(
+                    name="Test Player",
+                    position="QB",
+                    nfl_team_id="KC",
+                    espn_id="12345",
+                    jersey_number=15,
+                    height="6-3",
+                    weight=225,
+                    age=28,
+                    experience_years=6,
+                    college="Test College",
+                    is_injured=0,
+                    injury_status="ACTIVE",
+                    is_active=1,
+                ),
+                {"name": "Test Player", "position": "QB", "espn_id": "12345"},
+                ("jersey_number", 16),
+                id="player",
+            ),
+        ],
+    )
+    def test_crud(self, temp_database, model, expected, update):
+        """Test CRUD operations for a model's table"""
+        table = model.table_name
         with get_db_connection() as conn:
             # Create
-            player = Player(
-                name="Test Player",
-                position="QB",
-                nfl_team_id="KC",
-                espn_id="12345",
-                jersey_number=15,
-                height="6-3",
-                weight=225,
-                age=28,
-                experience_years=6,
-                college="Test College",
-                is_injured=0,
-                injury_status="ACTIVE",
-                is_active=1,
-            )
+            insert_models(conn, [model])
 
-            conn.execute(
-                """
-                INSERT INTO players (id, nfl_team_id, name, position, espn_id, jersey_number, height, weight, age, experience_years, college, is_injured, injury_status, is_active)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    player.id,
-                    player.nfl_team_id,
-                    player.name,
-                    player.position,
-                    player.espn_id,
-                    player.jersey_number,
-                    player.height,
-                    player.weight,
-                    player.age,
-                    player.experience_years,
-                    player.college,
-                    player.is_injured,
-                    player.injury_status,
-                    player.is_active,
-                ),
+            # Read back only the expected columns and compare them positionally
+            result = conn.execute(
+                f"SELECT {', '.join(expected)} FROM {table} WHERE id = ?", (model.id,)
             )
-
-            # Read
-            result = conn.execute("SELECT * FROM players WHERE id = ?", (player.id,))
             row = result.fetchone()
             assert row is not None
-            assert row["name"] == "Test Player"
-            assert row["position"] == "QB"
-            assert row["espn_id"] == "12345"
+            assert tuple(row) == tuple(expected.values())
 
             # Update
-            conn.execute("UPDATE players SET jersey_number = ? WHERE id = ?", (16, player.id))
+            column, value = update
+            conn.execute(f"UPDATE {table} SET {column} = ? WHERE id = ?", (value, model.id))
 
-            result = conn.execute("SELECT jersey_number FROM players WHERE id = ?", (player.id,))
+            result = conn.execute(f"SELECT {column} FROM {table} WHERE id = ?", (model.id,))
             row = result.fetchone()
-            assert row["jersey_number"] == 16
+            assert row[column] == value
 
             # Delete
-            conn.execute("DELETE FROM players WHERE id = ?", (player.id,))
-
-            result = conn.execute(
-                "SELECT COUNT(*) as count FROM players WHERE id = ?", (player.id,)
-            )
-            assert result.fetchone()["count"] == 0
+            conn.execute(f"DELETE FROM {table} WHERE id = ?", (model.id,))
 
-
-class TestDataValidation:
-    """Test data validation and constraints"""
-
-    def test_player_validation_constraints(self, temp_database):
-        """Test player data validation constraints"""
-        with get_db_connection() as conn:
-            # Test valid player
-            valid_player = Player(
-                name="Valid Player",
-                position="QB",
-                jersey_number=15,
-                weight=225,
-                age=28,
-                experience_years=6,
-                is_injured=0,
-                is_active=1,
-            )
-
-            # This should work
-            conn.execute(
-                """
-                INSERT INTO players (id, name, position, jersey_number, weight, age, experience_years, is_injured, is_active)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    valid_player.id,
-                    valid_player.name,
-                    valid_player.position,
-                    valid_player.jersey_number,
-                    valid_player.weight,
-                    valid_player.age,
-                    valid_player.experience_years,
-                    valid_player.is_injured,
-                    valid_player.is_active,
-                ),
-            )
-
-            # Test invalid jersey number (should be caught by model validation)
-            with pytest.raises(ValueError):
-                invalid_player = Player(
-                    name="Invalid Player",
-                    position="QB",
-                    jersey_number=100,  # Invalid: > 99
-                    is_injured=0,
-                    is_active=1,
-                )
-
-            # Test invalid weight (should be caught by model validation)
-            with pytest.raises(ValueError):
-                invalid_player = Player(
-                    name="Invalid Player",
-                    position="QB",
-                    weight=50,  # Invalid: < 100
-                    is_injured=0,
-                    is_active=1,
-                )
-
-    def test_fantasy_team_validation_constraints(self, temp_database):
-        """Test fantasy team data validation constraints"""
-        with get_db_connection() as conn:
-            # Test valid team
-            valid_team = FantasyTeam(
-                owner_name="Valid Owner",
-                team_name="Valid Team",
-                wins=8,
-                losses=5,
-                ties=0,
-                points_for=1200.5,
-                points_against=1150.2,
-            )
-
-            # This should work
-            conn.execute(
-                """
-                INSERT INTO fantasy_teams (id, owner_name, team_name, wins, losses, ties, points_for, points_against)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    valid_team.id,
-                    valid_team.owner_name,
-                    valid_team.team_name,
-                    valid_team.wins,
-                    valid_team.losses,
-                    valid_team.ties,
-                    valid_team.points_for,
-                    valid_team.points_against,
-                ),
-            )
-
-            # Test invalid record (should be caught by model validation)
-            with pytest.raises(ValueError):
-                invalid_team = FantasyTeam(
-                    owner_name="Invalid Owner",
-                    team_name="Invalid Team",
-                    wins=-1,  # Invalid: negative
-                    losses=5,
-                    ties=0,
-                    points_for=1200.5,
-                    points_against=1150.2,
-                )
+            result = conn.execute(f"SELECT 1 FROM {table} WHERE id = ? LIMIT 1", (model.id,))
+            assert result.fetchone() is None
 
 
 class TestDatabaseUtilityFunctions:
@@ -414,11 +216,7 @@ class TestDatabaseUtilityFunctions:
 
     def test_execute_query(self, temp_database):
         """Test execute_query function"""
-        # Clear any existing data first
         with get_db_connection() as conn:
-            conn.execute("DELETE FROM fantasy_teams WHERE id = ?", ("test-id",))
-            conn.commit()
-
             # Insert test data
             conn.execute(
                 "INSERT INTO fantasy_teams (id, owner_name, team_name) VALUES (?, ?, ?)",
@@ -486,9 +284,35 @@ class TestDatabaseUtilityFunctions:
 
         # Verify deletion
         results = execute_query(
-            "SELECT COUNT(*) as count FROM fantasy_teams WHERE id = ?", ("delete-test-id",)
+            "SELECT 1 FROM fantasy_teams WHERE id = ? LIMIT 1", ("delete-test-id",)
         )
-        assert results[0]["count"] == 0
+        assert results == []
+
+    def test_execute_helpers_with_connection(self, temp_database):
+        """Test the execute helpers reuse a given connection and leave the commit to it"""
+        with get_db_connection() as conn:
+            execute_insert(
+                "INSERT INTO fantasy_teams (id, owner_name, team_name) VALUES (?, ?, ?)",
+                ("conn-test-id", "Conn Owner", "Conn Team"),
+                conn=conn,
+            )
+            affected_rows = execute_update(
+                "UPDATE fantasy_teams SET owner_name = ? WHERE id = ?",
+                ("Updated Owner", "conn-test-id"),
+                conn=conn,
+            )
+            assert affected_rows == 1
+
+            results = execute_query(
+                "SELECT owner_name FROM fantasy_teams WHERE id = ?", ("conn-test-id",), conn=conn
+            )
+            assert results[0]["owner_name"] == "Updated Owner"
+
+            assert execute_delete("DELETE FROM fantasy_teams", conn=conn) == 1
+            conn.rollback()
+
+        # Nothing was committed, so other connections never saw the row
+        assert execute_query("SELECT id FROM fantasy_teams") == []
 
 
 class TestErrorHandling:
@@ -507,23 +331,16 @@ class TestErrorHandling:
                 ("test-id", "Owner", "Team", "extra_column"),  # Too many values
             )
 
-    def test_connection_error_handling(self):
+    def test_connection_error_handling(self, monkeypatch):
         """Test handling of connection errors"""
         # Temporarily set invalid database path
-        original_path = os.getenv("SQLITE_DB_PATH")
-        os.environ["SQLITE_DB_PATH"] = "/invalid/path/database.db"
+        monkeypatch.setenv("SQLITE_DB_PATH", "/invalid/path/database.db")
 
         # Test that we get an error when trying to connect to invalid path
         with pytest.raises((OSError, sqlite3.OperationalError)):
             with get_db_connection() as conn:
                 conn.execute("SELECT 1")
 
-        # Restore original path
-        if original_path:
-            os.environ["SQLITE_DB_PATH"] = original_path
-        else:
-            del os.environ["SQLITE_DB_PATH"]
-
 
 class TestDataIntegrity:
     """Test data integrity and relationships"""
@@ -537,13 +354,7 @@ class TestDataIntegrity:
                 team_name="Test Team",
             )
 
-            conn.execute(
-                """
-                INSERT INTO fantasy_teams (id, owner_name, team_name)
-                VALUES (?, ?, ?)
-                """,
-                (team.id, team.owner_name, team.team_name),
-            )
+            insert_models(conn, [team])
 
             # Create a player
             player = Player(
@@ -551,13 +362,7 @@ class TestDataIntegrity:
                 position="QB",
             )
 
-            conn.execute(
-                """
-                INSERT INTO players (id, name, position)
-                VALUES (?, ?, ?)
-                """,
-                (player.id, player.name, player.position),
-            )
+            insert_models(conn, [player])
 
             # Create a roster entry (should work)
             roster_entry = RosterEntry(
@@ -565,13 +370,7 @@ class TestDataIntegrity:
                 player_id=player.id,
             )
 
-            conn.execute(
-                """
-                INSERT INTO roster_entries (id, fantasy_team_id, player_id)
-                VALUES (?, ?, ?)
-                """,
-                (roster_entry.id, roster_entry.fantasy_team_id, roster_entry.player_id),
-            )
+            insert_models(conn, [roster_entry])
 
             # Verify the relationship
             result = conn.execute(
@@ -587,17 +386,11 @@ class TestDataIntegrity:
 
             row = result.fetchone()
             assert row is not None
-            assert row["team_name"] == "Test Team"
-            assert row["name"] == "Test Player"
+            assert tuple(row) == ("Test Team", "Test Player")
 
     def test_data_consistency(self, temp_database):
         """Test data consistency across related tables"""
         with get_db_connection() as conn:
-            # Clear existing data first
-            conn.execute("DELETE FROM fantasy_teams")
-            conn.execute("DELETE FROM league_config")
-            conn.commit()
-
             # Insert test data
             league_config = LeagueConfig(
                 league_name="Test League",
@@ -606,32 +399,13 @@ class TestDataIntegrity:
                 team_count=2,
             )
 
-            conn.execute(
-                """
-                INSERT INTO league_config (id, league_name, platform, season_year, team_count)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (
-                    league_config.id,
-                    league_config.league_name,
-                    league_config.platform,
-                    league_config.season_year,
-                    league_config.team_count,
-                ),
-            )
+            insert_models(conn, [league_config])
 
             # Insert teams
             team1 = FantasyTeam(owner_name="Owner 1", team_name="Team 1")
             team2 = FantasyTeam(owner_name="Owner 2", team_name="Team 2")
 
-            conn.execute(
-                "INSERT INTO fantasy_teams (id, owner_name, team_name) VALUES (?, ?, ?)",
-                (team1.id, team1.owner_name, team1.team_name),
-            )
-            conn.execute(
-                "INSERT INTO fantasy_teams (id, owner_name, team_name) VALUES (?, ?, ?)",
-                (team2.id, team2.owner_name, team2.team_name),
-            )
+            insert_models(conn, [team1, team2])
             conn.commit()
 
             # Verify team count matches league config
@@ -4,146 +4,43 @@ Tests for ESPN adapter functionality
 
 import os
 import sys
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
-from src.espn import convert_players, get_all_players, get_league_data
+from src.espn import convert_player, convert_players, get_all_players, get_league_data
 from src.logging_config import get_logger
 
+# Player ids in mock_espn_league: "1"-"3" from rosters, "4"-"5" from free agents
+EXPECTED_PLAYER_IDS = frozenset({"1", "2", "3", "4", "5"})
+EXPECTED_NO_FREE_AGENT_PLAYER_IDS = frozenset({"1"})
 
-@pytest.fixture
-def mock_espn_league():
-    """Create a mock ESPN league for testing"""
-    mock_league = Mock()
-
-    # Mock teams with rosters
-    mock_team1 = Mock()
-
-    # Create player 1
-    player1 = Mock()
-    player1.playerId = "1"
-    player1.name = "Player 1"
-    player1.position = "QB"
-    player1.proTeamId = "KC"
-    player1.jersey = 15
-    player1.height = "6-3"
-    player1.weight = 225
-    player1.age = 28
-    player1.experience = 6
-    player1.college = "Texas Tech"
-    player1.injured = False
-    player1.injuryStatus = "ACTIVE"
-    player1.active = True
-
-    # Create player 2
-    player2 = Mock()
-    player2.playerId = "2"
-    player2.name = "Player 2"
-    player2.position = "RB"
-    player2.proTeamId = "NE"
-    player2.jersey = 12
-    player2.height = "6-0"
-    player2.weight = 220
-    player2.age = 25
-    player2.experience = 3
-    player2.college = "Alabama"
-    player2.injured = False
-    player2.injuryStatus = "ACTIVE"
-    player2.active = True
-
-    mock_team1.roster = [player1, player2]
-
-    mock_team2 = Mock()
-
-    # Create player 3
-    player3 = Mock()
-    player3.playerId = "3"
-    player3.name = "Player 3"
-    player3.position = "WR"
-    player3.proTeamId = "LV"
-    player3.jersey = 17
-    player3.height = "6-1"
-    player3.weight = 215
-    player3.age = 31
-    player3.experience = 10
-    player3.college = "Fresno State"
-    player3.injured = False
-    player3.injuryStatus = "ACTIVE"
-    player3.active = True
-
-    mock_team2.roster = [player3]
-
-    mock_league.teams = [mock_team1, mock_team2]
-
-    # Mock free agents as a method that returns a list
-    # Create free agent 1
-    free_agent1 = Mock()
-    free_agent1.playerId = "4"
-    free_agent1.name = "Free Agent 1"
-    free_agent1.position = "TE"
-    free_agent1.proTeamId = "BUF"
-    free_agent1.jersey = 85
-    free_agent1.height = "6-4"
-    free_agent1.weight = 250
-    free_agent1.age = 26
-    free_agent1.experience = 4
-    free_agent1.college = "Iowa"
-    free_agent1.injured = False
-    free_agent1.injuryStatus = "ACTIVE"
-    free_agent1.active = True
-
-    # Create free agent 2
-    free_agent2 = Mock()
-    free_agent2.playerId = "5"
-    free_agent2.name = "Free Agent 2"
-    free_agent2.position = "K"
-    free_agent2.proTeamId = "SF"
-    free_agent2.jersey = 9
-    free_agent2.height = "6-1"
-    free_agent2.weight = 190
-    free_agent2.age = 29
-    free_agent2.experience = 7
-    free_agent2.college = "Georgia"
-    free_agent2.injured = False
-    free_agent2.injuryStatus = "ACTIVE"
-    free_agent2.active = True
-
-    mock_league.free_agents = Mock(return_value=[free_agent1, free_agent2])
-
-    return mock_league
-
-
-@pytest.fixture
-def mock_espn_league_no_free_agents():
-    """Create a mock ESPN league without free agents"""
-    mock_league = Mock()
-
-    mock_team1 = Mock()
-
-    # Create player 1
-    player1 = Mock()
-    player1.playerId = "1"
-    player1.name = "Player 1"
-    player1.position = "QB"
-    player1.proTeamId = "KC"
-    player1.jersey = 15
-    player1.height = "6-3"
-    player1.weight = 225
-    player1.age = 28
-    player1.experience = 6
-    player1.college = "Texas Tech"
-    player1.injured = False
-    player1.injuryStatus = "ACTIVE"
-    player1.active = True
-
-    mock_team1.roster = [player1]
-
-    mock_league.teams = [mock_team1]
-
-    # Mock free_agents to raise an exception
-    mock_league.free_agents = Mock(side_effect=Exception("No free agents"))
-
-    return mock_league
+
+@pytest.fixture(scope="module")
+def mock_espn_league(make_espn_player):
+    """Create a mock ESPN league for testing, shared by the read-only tests in this module"""
+    player1 = make_espn_player(playerId="1", name="Player 1")
+    player2 = make_espn_player(playerId="2", name="Player 2", position="RB", proTeamId="NE")
+    player3 = make_espn_player(playerId="3", name="Player 3", position="WR", proTeamId="LV")
+    free_agent1 = make_espn_player(playerId="4", name="Free Agent 1", position="TE")
+    free_agent2 = make_espn_player(playerId="5", name="Free Agent 2", position="K")
+
+    return SimpleNamespace(
+        teams=[SimpleNamespace(roster=[player1, player2]), SimpleNamespace(roster=[player3])],
+        # free_agents is a method on the real league
+        free_agents=Mock(return_value=[free_agent1, free_agent2]),
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_espn_league_no_free_agents(make_espn_player):
+    """Create a mock ESPN league without free agents, shared by the tests in this module"""
+    player1 = make_espn_player(playerId="1", name="Player 1")
+
+    return SimpleNamespace(
+        teams=[SimpleNamespace(roster=[player1])],
+        free_agents=Mock(side_effect=Exception("No free agents")),
+    )
 
 
 def test_get_all_players(mock_espn_league):
@@ -154,12 +51,8 @@ def test_get_all_players(mock_espn_league):
     assert len(all_players) == 5
 
     # Check that we have the expected players
-    player_ids = [str(getattr(p, "playerId", "")) for p in all_players]
-    assert "1" in player_ids  # From roster
-    assert "2" in player_ids  # From roster
-    assert "3" in player_ids  # From roster
-    assert "4" in player_ids  # From free agents
-    assert "5" in player_ids  # From free agents
+    player_ids = {str(getattr(p, "playerId", "")) for p in all_players}
+    assert player_ids == EXPECTED_PLAYER_IDS
 
 
 def test_get_all_players_no_free_agents(mock_espn_league_no_free_agents):
@@ -170,8 +63,8 @@ def test_get_all_players_no_free_agents(mock_espn_league_no_free_agents):
     assert len(all_players) == 1
 
     # Check that we have the expected player
-    player_ids = [str(getattr(p, "playerId", "")) for p in all_players]
-    assert "1" in player_ids
+    player_ids = {str(getattr(p, "playerId", "")) for p in all_players}
+    assert player_ids == EXPECTED_NO_FREE_AGENT_PLAYER_IDS
 
 
 def test_convert_players(mock_espn_league):
@@ -219,67 +112,40 @@ def test_real_espn_league():
         # Show some player examples
         logger.info(f"\n📋 Sample Players:")
         for i, player in enumerate(players[:5]):
-            logger.info(
-                f"  {i + 1}. {player.name} ({player.position.value}) - ESPN ID: {player.espn_id}"
-            )
+            logger.info(f"  {i + 1}. {player.name} ({player.position}) - ESPN ID: {player.espn_id}")
 
     except Exception as e:
         pytest.fail(f"Real ESPN test failed: {e}")
 
 
-def test_convert_player_with_injury_status():
+def test_convert_player_with_injury_status(make_espn_player):
     """Test converting a player with injury status"""
-    from src.espn import convert_player
-
-    # Mock injured player
-    mock_player = Mock()
-    mock_player.playerId = "123"
-    mock_player.name = "Injured Player"  # Set as string, not Mock
-    mock_player.position = "RB"
-    mock_player.proTeamId = "NE"
-    mock_player.jersey = 12
-    mock_player.height = "6-0"
-    mock_player.weight = 220
-    mock_player.age = 25
-    mock_player.experience = 3
-    mock_player.college = "Alabama"
-    mock_player.injured = True
-    mock_player.injuryStatus = "QUESTIONABLE"
-    mock_player.active = True
+    mock_player = make_espn_player(
+        playerId="123",
+        name="Injured Player",
+        position="RB",
+        proTeamId="NE",
+        injured=True,
+        injuryStatus="QUESTIONABLE",
+    )
 
     player = convert_player(mock_player)
 
     assert player.name == "Injured Player"
-    assert player.position.value == "RB"
+    assert player.position == "RB"
     assert player.nfl_team_id == "NE"
     assert player.is_injured == 1  # Should be converted to integer for SQLite
     assert player.injury_status == "QUESTIONABLE"
 
 
-def test_convert_player_with_team_info():
+def test_convert_player_with_team_info(make_espn_player):
     """Test converting a player with team information"""
-    from src.espn import convert_player
-
-    # Mock player with team info
-    mock_player = Mock()
-    mock_player.playerId = "456"
-    mock_player.name = "Team Player"  # Set as string, not Mock
-    mock_player.position = "QB"
-    mock_player.proTeamId = "KC"
-    mock_player.jersey = 15
-    mock_player.height = "6-3"
-    mock_player.weight = 225
-    mock_player.age = 28
-    mock_player.experience = 6
-    mock_player.college = "Texas Tech"
-    mock_player.injured = False
-    mock_player.injuryStatus = "ACTIVE"
-    mock_player.active = True
+    mock_player = make_espn_player(playerId="456", name="Team Player")
 
     player = convert_player(mock_player)
 
     assert player.name == "Team Player"
-    assert player.position.value == "QB"
+    assert player.position == "QB"
     assert player.nfl_team_id == "KC"
     assert player.jersey_number == 15
     assert player.height == "6-3"
@@ -0,0 +1,120 @@
+"""
+Tests for the FastAPI endpoints
+"""
+
+import anyio
+import httpx
+import orjson
+import pytest
+from src.cache import clear_all_caches
+from src.database import get_db_connection, insert_models
+from src.main import STREAM_BATCH_SIZE, app
+from src.models import FantasyTeam, Player, RosterEntry
+
+# More players than fit in one streamed batch, so every stream spans several batches
+PLAYER_COUNT = STREAM_BATCH_SIZE * 2 + 1
+
+
+@pytest.fixture
+def players(temp_database):
+    """Store enough players to stream in several batches"""
+    players = [Player(name=f"Player {i:04d}", position="QB") for i in range(PLAYER_COUNT)]
+    with get_db_connection() as conn:
+        insert_models(conn, players)
+        conn.commit()
+    return players
+
+
+@pytest.fixture
+def rosters(temp_database):
+    """Store two rostered teams and one empty team, with no cached responses around"""
+    clear_all_caches()
+    contenders = FantasyTeam(owner_name="Owner A", team_name="Contenders", points_for=1500.0)
+    underdogs = FantasyTeam(owner_name="Owner B", team_name="Underdogs", points_for=1200.0)
+    empty = FantasyTeam(owner_name="Owner C", team_name="Empty", points_for=900.0)
+    players = {
+        name: Player(name=name, position=position)
+        for name, position in [
+            ("Kicker", "K"),
+            ("Quarterback", "QB"),
+            ("Bench Back", "RB"),
+            ("Starting Back", "RB"),
+            ("Receiver", "WR"),
+            ("Tight End", "TE"),
+        ]
+    }
+    # Entries alternate between teams, so grouping relies on the query's ordering
+    entries = [
+        RosterEntry(fantasy_team_id=contenders.id, player_id=players["Kicker"].id),
+        RosterEntry(fantasy_team_id=underdogs.id, player_id=players["Receiver"].id),
+        RosterEntry(fantasy_team_id=contenders.id, player_id=players["Bench Back"].id),
+        RosterEntry(fantasy_team_id=underdogs.id, player_id=players["Tight End"].id),
+        RosterEntry(
+            fantasy_team_id=contenders.id, player_id=players["Starting Back"].id, is_starting=1
+        ),
+        RosterEntry(fantasy_team_id=contenders.id, player_id=players["Quarterback"].id),
+    ]
+    with get_db_connection() as conn:
+        insert_models(conn, [contenders, underdogs, empty])
+        insert_models(conn, list(players.values()))
+        insert_models(conn, entries)
+        conn.commit()
+    yield
+    clear_all_caches()
+
+
+def test_teams_with_players(rosters):
+    """Test that each team gets its own players, counts, and composition, in display order"""
+
+    async def main():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/api/teams-with-players")
+
+    response = anyio.run(main)
+
+    assert response.status_code == 200
+    teams = response.json()["teams"]
+    assert [team["team_name"] for team in teams] == ["Contenders", "Underdogs", "Empty"]
+
+    contenders, underdogs, empty = teams
+    assert [player["name"] for player in contenders["players"]] == [
+        "Quarterback",
+        "Starting Back",
+        "Bench Back",
+        "Kicker",
+    ]
+    assert contenders["player_count"] == 4
+    assert contenders["roster_composition"] == {"QB": 1, "RB": 2, "K": 1}
+
+    assert [player["name"] for player in underdogs["players"]] == ["Receiver", "Tight End"]
+    assert underdogs["player_count"] == 2
+    assert underdogs["roster_composition"] == {"WR": 1, "TE": 1}
+
+    assert empty["players"] == []
+    assert empty["player_count"] == 0
+    assert empty["roster_composition"] == {}
+
+
+def test_stream_players_concurrently(players):
+    """Test that concurrent streams each return every player, in name order"""
+    expected = sorted(player.name for player in players)
+    results = []
+
+    async def stream(client):
+        response = await client.get("/api/players/stream")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        results.append([orjson.loads(line)["name"] for line in response.text.splitlines()])
+
+    async def main():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            async with anyio.create_task_group() as task_group:
+                for _ in range(40):
+                    task_group.start_soon(stream, client)
+
+    anyio.run(main)
+
+    assert len(results) == 40
+    assert all(names == expected for names in results)
@@ -10,14 +10,16 @@ Tests cover:
 """
 
 import os
-from dataclasses import asdict
 from datetime import datetime
 
 import pytest
+from src.database import get_db_connection
+from src.init_data import init_sample_data
 from src.logging_config import get_logger
 from src.models import (
     AcquisitionType,
     Conference,
+    DatabaseModel,
     Division,
     FantasyMatchup,
     FantasyTeam,
@@ -41,6 +43,7 @@ from src.models import (
     TradeProposal,
     TradeStatus,
     WaiverPriority,
+    skip_validation,
 )
 
 logger = get_logger(__name__)
@@ -51,14 +54,16 @@ class TestPositionEnum:
 
     def test_position_values(self):
         """Test that all position values are correct"""
-        assert Position.QB.value == "QB"
-        assert Position.RB.value == "RB"
-        assert Position.WR.value == "WR"
-        assert Position.TE.value == "TE"
-        assert Position.K.value == "K"
-        assert Position.DEF.value == "DEF"
-        assert Position.FLEX.value == "FLEX"
-        assert Position.SUPERFLEX.value == "SUPERFLEX"
+        assert {m.name: m.value for m in Position} == {
+            "QB": "QB",
+            "RB": "RB",
+            "WR": "WR",
+            "TE": "TE",
+            "K": "K",
+            "DEF": "DEF",
+            "FLEX": "FLEX",
+            "SUPERFLEX": "SUPERFLEX",
+        }
 
     def test_position_comparison(self):
         """Test position comparison"""
@@ -72,10 +77,12 @@ class TestPlatformEnum:
 
     def test_platform_values(self):
         """Test that all platform values are correct"""
-        assert Platform.ESPN.value == "ESPN"
-        assert Platform.YAHOO.value == "Yahoo"
-        assert Platform.SLEEPER.value == "Sleeper"
-        assert Platform.CUSTOM.value == "Custom"
+        assert {m.name: m.value for m in Platform} == {
+            "ESPN": "ESPN",
+            "YAHOO": "Yahoo",
+            "SLEEPER": "Sleeper",
+            "CUSTOM": "Custom",
+        }
 
 
 class TestScoringTypeEnum:
@@ -83,9 +90,11 @@ class TestScoringTypeEnum:
 
     def test_scoring_type_values(self):
         """Test that all scoring type values are correct"""
-        assert ScoringType.STANDARD.value == "Standard"
-        assert ScoringType.PPR.value == "PPR"
-        assert ScoringType.HALF_PPR.value == "Half-PPR"
+        assert {m.name: m.value for m in ScoringType} == {
+            "STANDARD": "Standard",
+            "PPR": "PPR",
+            "HALF_PPR": "Half-PPR",
+        }
 
 
 class TestLeagueConfig:
@@ -113,8 +122,7 @@ class TestLeagueConfig:
         assert config.is_active == 1
 
     def test_league_config_validation(self):
-        """Test LeagueConfig validation"""
-        # Test valid config
+        """Test that a minimal LeagueConfig is valid"""
         config = LeagueConfig(
             league_name="Valid League",
             platform="ESPN",
@@ -122,62 +130,23 @@ class TestLeagueConfig:
         )
         assert config.league_name == "Valid League"
 
-        # Test invalid league name (too long)
-        with pytest.raises(ValueError, match="League name must be 1-100 characters"):
-            LeagueConfig(
-                league_name="A" * 101,  # Too long
-                platform="ESPN",
-                season_year=2024,
-            )
-
-        # Test invalid season year
-        with pytest.raises(ValueError, match="Season year must be 2000-2030"):
-            LeagueConfig(
-                league_name="Test League",
-                platform="ESPN",
-                season_year=1999,  # Too early
-            )
-
-        with pytest.raises(ValueError, match="Season year must be 2000-2030"):
-            LeagueConfig(
-                league_name="Test League",
-                platform="ESPN",
-                season_year=2031,  # Too late
-            )
-
-        # Test invalid team count
-        with pytest.raises(ValueError, match="Team count must be 2-32"):
-            LeagueConfig(
-                league_name="Test League",
-                platform="ESPN",
-                season_year=2024,
-                team_count=1,  # Too few
-            )
-
-        with pytest.raises(ValueError, match="Team count must be 2-32"):
-            LeagueConfig(
-                league_name="Test League",
-                platform="ESPN",
-                season_year=2024,
-                team_count=33,  # Too many
-            )
-
-        # Test invalid playoff teams
-        with pytest.raises(ValueError, match="Playoff teams must be 2-16"):
-            LeagueConfig(
-                league_name="Test League",
-                platform="ESPN",
-                season_year=2024,
-                playoff_teams=1,  # Too few
-            )
-
-        with pytest.raises(ValueError, match="Playoff teams must be 2-16"):
-            LeagueConfig(
-                league_name="Test League",
-                platform="ESPN",
-                season_year=2024,
-                playoff_teams=17,  # Too many
-            )
+    @pytest.mark.parametrize(
+        "overrides, message",
+        [
+            ({"league_name": "A" * 101}, "League name must be 1-100 characters"),
+            ({"season_year": 1999}, "Season year must be 2000-2030"),
+            ({"season_year": 2031}, "Season year must be 2000-2030"),
+            ({"team_count": 1}, "Team count must be 2-32"),
+            ({"team_count": 33}, "Team count must be 2-32"),
+            ({"playoff_teams": 1}, "Playoff teams must be 2-16"),
+            ({"playoff_teams": 17}, "Playoff teams must be 2-16"),
+        ],
+    )
+    def test_invalid_league_config(self, overrides, message):
+        """Test LeagueConfig validation errors"""
+        kwargs = {"league_name": "Test League", "platform": "ESPN", "season_year": 2024}
+        with pytest.raises(ValueError, match=message):
+            LeagueConfig(**(kwargs | overrides))
 
 
 class TestFantasyTeam:
@@ -290,7 +259,7 @@ class TestPlayer:
         )
 
         assert player.name == "Test Player"
-        assert player.position.value == "QB"
+        assert player.position == "QB"
         assert player.nfl_team_id == "KC"
         assert player.espn_id == "12345"
         assert player.jersey_number == 15
@@ -304,80 +273,35 @@ class TestPlayer:
         assert player.is_active == 1
 
     def test_player_validation(self):
-        """Test Player validation"""
-        # Test valid player
+        """Test that a minimal Player is valid"""
         player = Player(
             name="Valid Player",
             position="QB",
         )
         assert player.name == "Valid Player"
 
-        # Test invalid name (too long)
-        with pytest.raises(ValueError, match="Player name must be 1-100 characters"):
-            Player(
-                name="A" * 101,  # Too long
-                position="QB",
-            )
-
-        # Test invalid jersey number
-        with pytest.raises(ValueError, match="Jersey number must be 0-99"):
-            Player(
-                name="Test Player",
-                position="QB",
-                jersey_number=100,  # Too high
-            )
-
-        with pytest.raises(ValueError, match="Jersey number must be 0-99"):
-            Player(
-                name="Test Player",
-                position="QB",
-                jersey_number=-1,  # Too low
-            )
-
-        # Test invalid weight
-        with pytest.raises(ValueError, match="Weight must be 100-400 pounds"):
-            Player(
-                name="Test Player",
-                position="QB",
-                weight=50,  # Too low
-            )
-
-        with pytest.raises(ValueError, match="Weight must be 100-400 pounds"):
-            Player(
-                name="Test Player",
-                position="QB",
-                weight=500,  # Too high
-            )
-
-        # Test invalid age
-        with pytest.raises(ValueError, match="Age must be 18-50"):
-            Player(
-                name="Test Player",
-                position="QB",
-                age=17,  # Too young
-            )
-
-        with pytest.raises(ValueError, match="Age must be 18-50"):
-            Player(
-                name="Test Player",
-                position="QB",
-                age=51,  # Too old
-            )
-
-        # Test invalid experience years
-        with pytest.raises(ValueError, match="Experience years must be 0-25"):
-            Player(
-                name="Test Player",
-                position="QB",
-                experience_years=-1,  # Too low
-            )
-
-        with pytest.raises(ValueError, match="Experience years must be 0-25"):
-            Player(
-                name="Test Player",
-                position="QB",
-                experience_years=26,  # Too high
-            )
+        # Test Enum positions are stored as their string value
+        assert Player(name="Enum Player", position=Position.WR).position == "WR"
+
+    @pytest.mark.parametrize(
+        "overrides, message",
+        [
+            ({"name": "A" * 101}, "Player name must be 1-100 characters"),
+            ({"position": "XX"}, "Invalid position"),
+            ({"jersey_number": 100}, "Jersey number must be 0-99"),
+            ({"jersey_number": -1}, "Jersey number must be 0-99"),
+            ({"weight": 50}, "Weight must be 100-400 pounds"),
+            ({"weight": 500}, "Weight must be 100-400 pounds"),
+            ({"age": 17}, "Age must be 18-50"),
+            ({"age": 51}, "Age must be 18-50"),
+            ({"experience_years": -1}, "Experience years must be 0-25"),
+            ({"experience_years": 26}, "Experience years must be 0-25"),
+        ],
+    )
+    def test_invalid_player(self, overrides, message):
+        """Test Player validation errors"""
+        with pytest.raises(ValueError, match=message):
+            Player(**({"name": "Test Player", "position": "QB"} | overrides))
 
     def test_player_with_optional_fields(self):
         """Test Player with optional fields set to None"""
@@ -396,7 +320,7 @@ class TestPlayer:
         )
 
         assert player.name == "Test Player"
-        assert player.position.value == "QB"
+        assert player.position == "QB"
         assert player.nfl_team_id is None
         assert player.espn_id is None
         assert player.jersey_number is None
@@ -583,10 +507,16 @@ class TestRosterPosition:
             is_bench=0,
         )
 
-        assert position.position.value == "QB"
+        assert position.position == "QB"
         assert position.count == 1
         assert position.is_bench == 0
 
+    def test_bench_roster_position(self):
+        """Test that the bench is a valid roster position"""
+        position = RosterPosition(position="BN", count=6, is_bench=1)
+
+        assert position.position == "BN"
+
     def test_roster_position_validation(self):
         """Test RosterPosition validation"""
         # Test valid position
@@ -594,7 +524,14 @@ class TestRosterPosition:
             position=Position.QB,
             count=1,
         )
-        assert position.position.value == "QB"
+        assert position.position == "QB"
+
+        # Test invalid position
+        with pytest.raises(ValueError, match="Invalid roster position"):
+            RosterPosition(
+                position="XX",
+                count=1,
+            )
 
         # Test invalid count
         with pytest.raises(ValueError, match="Position count must be 0-10"):
@@ -660,7 +597,11 @@ class TestPlayerGameStats:
 
 
 class TestModelSerialization:
-    """Test model serialization and deserialization"""
+    """
+    Test model serialization and deserialization
+
+    Models are slotted and have no __dict__, so serialization is checked through to_dict.
+    """
 
     def test_league_config_serialization(self):
         """Test LeagueConfig serialization"""
@@ -671,7 +612,7 @@ class TestModelSerialization:
         )
 
         # Convert to dict
-        config_dict = asdict(config)
+        config_dict = config.to_dict()
 
         assert config_dict["league_name"] == "Test League"
         assert config_dict["platform"] == "ESPN"
@@ -690,7 +631,7 @@ class TestModelSerialization:
         )
 
         # Convert to dict
-        player_dict = asdict(player)
+        player_dict = player.to_dict()
 
         assert player_dict["name"] == "Test Player"
         assert player_dict["position"] == "QB"
@@ -700,6 +641,115 @@ class TestModelSerialization:
         assert "created_at" in player_dict
         assert "updated_at" in player_dict
 
+    def test_enum_field_serialization(self):
+        """Test that Enum members are serialized as their value"""
+        entry = RosterEntry(
+            fantasy_team_id="team-123",
+            player_id="player-456",
+            acquisition_type=AcquisitionType.DRAFT,
+        )
+
+        entry_dict = entry.to_dict()
+
+        assert entry_dict["acquisition_type"] == "Draft"
+        assert list(entry_dict) == list(RosterEntry.column_names())
+
+
+class TestFromRow:
+    """Test building models from database rows"""
+
+    def test_player_from_row(self):
+        """Test Player.from_row converts enums and fills defaults"""
+        row = {"id": "player-123", "name": "Test Player", "position": "QB", "weight": 225}
+
+        player = Player.from_row(row)
+
+        assert player.id == "player-123"
+        assert player.name == "Test Player"
+        assert player.position == "QB"
+        assert player.weight == 225
+        assert player.is_active == 1
+        assert player.created_at is not None
+
+    def test_from_row_skips_validation(self):
+        """Test from_row trusts stored data instead of re-validating it"""
+        row = {"player_id": "player-123", "nfl_game_id": "game-456", "passing_yards": -5}
+
+        stats = PlayerGameStats.from_row(row)
+
+        assert stats.passing_yards == -5
+
+    def test_from_row_optional_enum(self):
+        """Test from_row handles optional Enum columns"""
+        row = {"fantasy_team_id": "team-1", "player_id": "player-1", "acquisition_type": None}
+        assert RosterEntry.from_row(row).acquisition_type is None
+
+        row["acquisition_type"] = "Trade"
+        assert RosterEntry.from_row(row).acquisition_type is AcquisitionType.TRADE
+
+    def test_from_row_missing_required_column(self):
+        """Test from_row rejects rows without required columns"""
+        with pytest.raises(KeyError, match="platform"):
+            LeagueConfig.from_row({"league_name": "Test League", "season_year": 2024})
+
+    def test_from_row_interns_low_cardinality_strings(self):
+        """Test from_row shares one string object per repeated position value"""
+        position = "".join(["Q", "B"])
+        first = Player.from_row({"name": "Player One", "position": position})
+        second = Player.from_row({"name": "Player Two", "position": "".join(["Q", "B"])})
+
+        assert first.position is second.position
+
+    def test_from_row_reads_sample_data(self, temp_database):
+        """Test every model loads the rows written by init_sample_data"""
+        init_sample_data()
+
+        loaded = 0
+        with get_db_connection() as conn:
+            for model in DatabaseModel.__subclasses__():
+                for row in conn.execute(f"SELECT * FROM {model.table_name}"):
+                    assert model.from_row(row).id == row["id"]
+                    loaded += 1
+
+        assert loaded > 0
+
+
+class TestSkipValidation:
+    """Test constructing models with validation disabled"""
+
+    def test_skip_validation(self):
+        """Test that validation is skipped only inside the context manager"""
+        with skip_validation():
+            player = Player(name="Test Player", position="QB", jersey_number=100)
+        assert player.jersey_number == 100
+
+        with pytest.raises(ValueError, match="Jersey number must be 0-99"):
+            Player(name="Test Player", position="QB", jersey_number=100)
+
+
+class TestTimestamps:
+    """Test created_at/updated_at defaults"""
+
+    def test_updated_at_defaults_to_created_at(self):
+        """Test updated_at shares created_at unless given, even without validation"""
+        player = Player(name="Test Player", position="QB", created_at="2024-09-01T12:00:00")
+        assert player.updated_at == "2024-09-01T12:00:00"
+
+        with skip_validation():
+            entry = RosterEntry(fantasy_team_id="team-1", player_id="player-1")
+        assert entry.updated_at == entry.created_at
+
+        team = FantasyTeam(owner_name="Owner", team_name="Team", updated_at="2024-09-02T08:00:00")
+        assert team.updated_at == "2024-09-02T08:00:00"
+
+    def test_from_row_updated_at_defaults_to_created_at(self):
+        """Test from_row applies the same updated_at fallback as __init__"""
+        row = {"name": "Test Player", "position": "QB", "created_at": "2024-09-01T12:00:00"}
+        assert Player.from_row(row).updated_at == "2024-09-01T12:00:00"
+
+        row["updated_at"] = "2024-09-02T08:00:00"
+        assert Player.from_row(row).updated_at == "2024-09-02T08:00:00"
+
 
 class TestModelRelationships:
     """Test model relationships and constraints"""